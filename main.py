@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 
-import os, sys, io, json, time, shutil, argparse, traceback
+import os, re, sys, io, json, time, shutil, sqlite3, argparse, itertools, traceback, mmap
 import urllib.request
 import urllib.error
 from pathlib import Path
@@ -9,8 +9,10 @@ from typing import Callable, List, Dict, Optional, Tuple, Set
 from datetime import datetime
 import threading
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from queue import PriorityQueue, Empty
 from contextlib import contextmanager
+from operator import itemgetter
 from html import escape as _h
 import xml.etree.ElementTree as ET
 
@@ -19,16 +21,35 @@ try:
 except Exception:
     piexif = None
 
+try:
+    import numba
+except Exception:
+    numba = None
+
+# Free-threaded builds lose the GIL's dict atomicity; lock-free cache reads
+# are only taken when it is on.
+_GIL_ENABLED = getattr(sys, '_is_gil_enabled', lambda: True)()
+
 import numpy as np
 from PIL import Image, ImageQt, ImageOps
 import rawpy
 
+# Resolve the resize filters once; Pillow >= 9.1 moved them under
+# Image.Resampling and the per-call getattr shows up in hot resize loops.
+if hasattr(Image, 'Resampling'):
+    RESIZE_FILTER_HQ = Image.Resampling.LANCZOS
+    RESIZE_FILTER_FAST = Image.Resampling.BILINEAR
+else:
+    RESIZE_FILTER_HQ = Image.LANCZOS
+    RESIZE_FILTER_FAST = Image.BILINEAR
+
 from PySide6.QtCore import (
     Qt,
     QSize,
     QRect,
     QRectF,
     QPoint,
+    QLine,
     QTimer,
     QObject,
     Signal,
@@ -57,6 +78,7 @@ from PySide6.QtGui import (
     QBrush,
     QShortcut,
     QDesktopServices,
+    QPalette,
 )
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QLabel, QFileDialog, QMessageBox, QFrame,
@@ -105,23 +127,69 @@ def _ptime(label: str, warn_ms: float = 16.0):
 SUPPORTED_EXTS = {
     '.cr3', '.cr2', '.nef', '.arw', '.raf', '.dng', '.orf', '.rw2', '.srw', '.pef'
 }
+# Frozen lowercase lookup sets built once; the directory-scan helpers test
+# every entry against these, and rebuilding literal sets per call adds up
+# on multi-thousand-file folders.
+_RAW_PLUS_XMP_EXTS = frozenset(SUPPORTED_EXTS) | {'.xmp'}
+_JPEG_EXTS = frozenset({'.jpg', '.jpeg'})
 
 
 def _list_paths_by_basename(folder: str, exts: Set[str]) -> Dict[str, List[str]]:
     out: Dict[str, List[str]] = {}
     try:
-        for fn in os.listdir(folder):
-            p = os.path.join(folder, fn)
-            if not os.path.isfile(p):
-                continue
-            base, ext = os.path.splitext(fn)
-            if ext.lower() in exts:
-                out.setdefault(base, []).append(p)
+        # scandir's DirEntry carries the file type from the directory read
+        # itself, so this avoids the extra stat() per entry that
+        # listdir+isfile would pay.
+        with os.scandir(folder) as it:
+            for e in it:
+                if not e.is_file():
+                    continue
+                base, ext = os.path.splitext(e.name)
+                if len(ext) > 5:
+                    continue
+                if ext.lower() in exts:
+                    out.setdefault(base, []).append(e.path)
     except Exception:
         pass
     return out
 
 
+_ensured_dirs: Set[str] = set()
+
+
+def _ensure_dir(path: str):
+    """makedirs(exist_ok=True), memoized so repeat exports skip the stat."""
+    if path in _ensured_dirs:
+        return
+    os.makedirs(path, exist_ok=True)
+    _ensured_dirs.add(path)
+
+
+def _copy_one(src: str, dst: str):
+    """Copy src to dst preserving metadata like shutil.copy2.
+
+    Prefers os.copy_file_range where the platform has it: the data never
+    leaves the kernel, and on reflink-capable filesystems (btrfs/XFS) an
+    80 MB RAW copy collapses into a metadata operation.
+    """
+    if hasattr(os, 'copy_file_range'):
+        remaining = -1
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    n = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if n == 0:
+                        break
+                    remaining -= n
+            if remaining == 0:
+                shutil.copystat(src, dst)
+                return
+        except OSError:
+            pass
+    shutil.copy2(src, dst)
+
+
 def _gather_source_presence(
     root: str, exts: Set[str], *, exclude_dirs: Optional[Set[str]] = None
 ) -> Set[Tuple[str, str]]:
@@ -158,14 +226,10 @@ def detect_orphan_sync_deletions(
     selected_raw_by_base = {
         os.path.splitext(os.path.basename(p))[0]: p for p in selected_paths
     }
-    root_jpegs_by_base = _list_paths_by_basename(root, {".jpg", ".jpeg"})
+    root_jpegs_by_base = _list_paths_by_basename(root, _JPEG_EXTS)
 
-    dest_raw_by_base = _list_paths_by_basename(
-        raw_out_dir, SUPPORTED_EXTS.union({".xmp"})
-    )
-    dest_jpg_by_base = _list_paths_by_basename(
-        jpeg_out_dir, {".jpg", ".jpeg"}
-    )
+    dest_raw_by_base = _list_paths_by_basename(raw_out_dir, _RAW_PLUS_XMP_EXTS)
+    dest_jpg_by_base = _list_paths_by_basename(jpeg_out_dir, _JPEG_EXTS)
 
     desired_jpg_bases = {
         base for base in selected_raw_by_base if base in root_jpegs_by_base
@@ -173,10 +237,10 @@ def detect_orphan_sync_deletions(
 
     exclude_dirs = {raw_out_dir, jpeg_out_dir}
     raw_presence = _gather_source_presence(
-        root, SUPPORTED_EXTS.union({".xmp"}), exclude_dirs=exclude_dirs
+        root, _RAW_PLUS_XMP_EXTS, exclude_dirs=exclude_dirs
     )
     jpeg_presence = _gather_source_presence(
-        root, {".jpg", ".jpeg"}, exclude_dirs=exclude_dirs
+        root, _JPEG_EXTS, exclude_dirs=exclude_dirs
     )
 
     orphan_paths: List[str] = []
@@ -353,7 +417,13 @@ def _styled_hotkey_label(action: str, fallback_text: str) -> Tuple[str, bool]:
 
     return fallback_text, False
 
-_XMP_GLOBAL_LOCK = threading.Lock()
+# Sidecar I/O only needs mutual exclusion per file; a striped lock map keeps
+# workers on different photos from serializing behind one global lock.
+_XMP_LOCK_STRIPES = [threading.Lock() for _ in range(64)]
+
+def _xmp_lock(xmp_path: str) -> threading.Lock:
+    return _XMP_LOCK_STRIPES[hash(xmp_path) & 63]
+
 class HotkeyDialog(QDialog):
     def __init__(self, parent: QWidget, hotkeys: Dict[str, str]):
         super().__init__(parent)
@@ -638,17 +708,77 @@ def _prepare_xmp_tree_for_write(xmp_path: str) -> Tuple[ET.ElementTree, ET.Eleme
     return _create_xmp_tree()
 
 
-def read_xmp_sidecar(path: str) -> Dict:
-    """Reads rating, label, and pick status from an XMP sidecar file."""
-    xmp_path = os.path.splitext(path)[0] + '.xmp'
+# Sidecars written by this app (and most others) carry the three fields we
+# care about as plain attribute or element text, so a few precompiled regexes
+# on the raw bytes beat a full XML parse per file during indexing.
+_XMP_RATING_RE = re.compile(
+    rb'xmp:Rating\s*=\s*"(-?\d+)"|<xmp:Rating>\s*(-?\d+)\s*</xmp:Rating>'
+)
+_XMP_LABEL_RE = re.compile(
+    rb'xmp:Label\s*=\s*"([^"]*)"|<xmp:Label>([^<]*)</xmp:Label>'
+)
+_XMP_URGENCY_RE = re.compile(
+    rb'photoshop:Urgency\s*=\s*"(-?\d+)"|<photoshop:Urgency>\s*(-?\d+)\s*</photoshop:Urgency>'
+)
+
+
+def _parse_xmp_fast(buf: bytes) -> Optional[Dict]:
+    """Extract rating/label/pick from raw sidecar bytes without an XML parse.
+
+    Returns None when the packet looks unusual (a field is present but the
+    regex cannot pin it down), signalling the caller to fall back to the
+    full ElementTree path.
+    """
+    data: Dict[str, object] = {}
 
-    with _XMP_GLOBAL_LOCK:
+    if b'xmp:Rating' in buf:
+        m = _XMP_RATING_RE.search(buf)
+        if not m:
+            return None
         try:
-            if not os.path.exists(xmp_path) or os.path.getsize(xmp_path) == 0:
-                return {}
-        except FileNotFoundError:
-            return {}
+            data['rating'] = int(m.group(1) or m.group(2))
+        except (TypeError, ValueError):
+            return None
+    elif b':Rating' in buf:
+        # Same field bound to another namespace prefix (e.g. legacy
+        # `xap:Rating`); only the prefix-independent ElementTree path can
+        # read those.
+        return None
+
+    if b'xmp:Label' in buf:
+        m = _XMP_LABEL_RE.search(buf)
+        if not m:
+            return None
+        raw_label = m.group(1) if m.group(1) is not None else (m.group(2) or b'')
+        if b'&' in raw_label:
+            # Entity-encoded label: let the real parser decode it.
+            return None
+        try:
+            label_val = raw_label.decode('utf-8').strip()
+        except UnicodeDecodeError:
+            return None
+        if label_val:
+            data['color_label'] = label_val
+    elif b':Label' in buf:
+        return None
+
+    if b'photoshop:Urgency' in buf:
+        m = _XMP_URGENCY_RE.search(buf)
+        if not m:
+            return None
+        try:
+            data['selected'] = int(m.group(1) or m.group(2)) == 1
+        except (TypeError, ValueError):
+            return None
+    elif b':Urgency' in buf:
+        return None
 
+    return data
+
+
+def _read_xmp_sidecar_slow(xmp_path: str) -> Dict:
+    """Full ElementTree fallback for sidecar packets the regexes can't handle."""
+    with _xmp_lock(xmp_path):
         tree = _try_parse_xmp(xmp_path)
         if tree is None:
             return {}
@@ -679,11 +809,87 @@ def read_xmp_sidecar(path: str) -> Dict:
         return data
 
 
-def write_xmp_sidecar(path: str, data: Dict):
-    """Writes rating, label, or pick status to an XMP sidecar file."""
+# Parsed sidecar results keyed by (path, mtime_ns, size): re-opening a folder
+# turns every unchanged sidecar read into a single os.stat.
+_XMP_CACHE: OrderedDict = OrderedDict()
+_XMP_CACHE_LIMIT = 4096
+_XMP_CACHE_LOCK = threading.Lock()
+
+
+def _xmp_cache_invalidate(xmp_path: str):
+    with _XMP_CACHE_LOCK:
+        stale = [key for key in _XMP_CACHE if key[0] == xmp_path]
+        for key in stale:
+            del _XMP_CACHE[key]
+
+
+def read_xmp_sidecar(path: str, st: Optional[os.stat_result] = None) -> Dict:
+    """Reads rating, label, and pick status from an XMP sidecar file.
+
+    `st` may carry a stat result for the sidecar gathered during directory
+    scanning (e.g. from os.scandir) to avoid re-statting it here.
+    """
+    xmp_path = os.path.splitext(path)[0] + '.xmp'
+
+    if st is None:
+        try:
+            st = os.stat(xmp_path)
+        except (FileNotFoundError, OSError):
+            return {}
+    if st.st_size == 0:
+        return {}
+
+    cache_key = (xmp_path, st.st_mtime_ns, st.st_size)
+    with _XMP_CACHE_LOCK:
+        cached = _XMP_CACHE.get(cache_key)
+        if cached is not None:
+            _XMP_CACHE.move_to_end(cache_key)
+            return cached
+
+    try:
+        with open(xmp_path, 'rb') as f:
+            buf = f.read()
+    except OSError:
+        return {}
+
+    data = _parse_xmp_fast(buf)
+    if data is None:
+        data = _read_xmp_sidecar_slow(xmp_path)
+
+    with _XMP_CACHE_LOCK:
+        _XMP_CACHE[cache_key] = data
+        while len(_XMP_CACHE) > _XMP_CACHE_LIMIT:
+            _XMP_CACHE.popitem(last=False)
+
+    return data
+
+
+def _write_text_atomic(path: str, text: str, fsync: bool = True):
+    """Write text to path via a temp file and os.replace.
+
+    A plain open('w') truncates first, so a crash mid-write loses the
+    previous state file; the rename publishes the new content whole.
+    """
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+        f.flush()
+        if fsync:
+            os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def write_xmp_sidecar(path: str, data: Dict, fsync: bool = False):
+    """Writes rating, label, or pick status to an XMP sidecar file.
+
+    The packet is written to a temp file and moved into place with
+    os.replace so readers never see a half-written sidecar. `fsync` is only
+    requested by blocking flushes (quit/export); routine autosaves let the
+    OS schedule the flush.
+    """
     xmp_path = os.path.splitext(path)[0] + '.xmp'
 
-    with _XMP_GLOBAL_LOCK:
+    with _xmp_lock(xmp_path):
         try:
             tree, desc = _prepare_xmp_tree_for_write(xmp_path)
 
@@ -708,11 +914,22 @@ def write_xmp_sidecar(path: str, data: Dict):
                 key = f'{{{_PHOTOSHOP_NS}}}Urgency'
                 desc.set(key, '1' if bool(data['selected']) else '0')
 
-            tree.write(xmp_path, encoding='utf-8', xml_declaration=True)
+            tmp_path = xmp_path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                tree.write(f, encoding='utf-8', xml_declaration=True)
+                f.flush()
+                if fsync:
+                    os.fsync(f.fileno())
+            os.replace(tmp_path, xmp_path)
+            _xmp_cache_invalidate(xmp_path)
             return True
 
         except Exception as e:
             print(f"Error writing XMP for {os.path.basename(path)}: {e}")
+            try:
+                os.remove(xmp_path + '.tmp')
+            except OSError:
+                pass
             return False
 
     return True
@@ -866,26 +1083,32 @@ def _ratarr_to_tuple(v):
         except Exception:
             return None
 
+# Tag ids used by _exif_to_meta; built once instead of per image.
+TAG = {
+    'Make': 271, 'Model': 272,
+    'LensModel': 0xA434, 'LensInfo': 0xA432,
+    'FNumber': 0x829D, 'ExposureTime': 0x829A,
+    'ShutterSpeedValue': 0x9201, 'ApertureValue': 0x9202,
+    'ISOSpeedRatings': 0x8827, 'PhotographicSensitivity': 0x8833,
+    'FocalLength': 0x920A,
+    'DateTimeOriginal': 0x9003, 'DateTimeDigitized': 0x9004, 'DateTime': 0x0132,
+    'SubSecTimeOriginal': 0x9291,'SubSecTimeDigitized': 0x9292,'SubSecTime': 0x9290,
+}
+
+
 def _exif_to_meta(exif, meta: Dict[str, str]):
-    def get(tagid):
-        return exif.get(tagid)
+    get = exif.get
+
     def updf(key, val):
         if val is None: return
         if not meta.get(key): meta[key] = val
 
-    TAG = {
-        'Make': 271, 'Model': 272,
-        'LensModel': 0xA434, 'LensInfo': 0xA432,
-        'FNumber': 0x829D, 'ExposureTime': 0x829A,
-        'ShutterSpeedValue': 0x9201, 'ApertureValue': 0x9202,
-        'ISOSpeedRatings': 0x8827, 'PhotographicSensitivity': 0x8833,
-        'FocalLength': 0x920A,
-        'DateTimeOriginal': 0x9003, 'DateTimeDigitized': 0x9004, 'DateTime': 0x0132,
-        'SubSecTimeOriginal': 0x9291,'SubSecTimeDigitized': 0x9292,'SubSecTime': 0x9290,
-    }
-
-    updf('make',  get(TAG['Make'])  and str(get(TAG['Make'])))
-    updf('model', get(TAG['Model']) and str(get(TAG['Model'])))
+    make = get(TAG['Make'])
+    if make:
+        updf('make', str(make))
+    model = get(TAG['Model'])
+    if model:
+        updf('model', str(model))
 
     lens_model = get(TAG['LensModel'])
     if lens_model:
@@ -974,21 +1197,60 @@ def _exif_to_meta(exif, meta: Dict[str, str]):
 
 def _open_jpeg_transposed(path: str) -> Image.Image:
     img = Image.open(path); img.load()
-    try: img = ImageOps.exif_transpose(img)
+    try:
+        # Orientation 1 (or absent) needs no transpose; skip the copy
+        # exif_transpose would make for the common case.
+        if img.getexif().get(0x0112, 1) != 1:
+            img = ImageOps.exif_transpose(img)
     except Exception: pass
     return img
 
+# Embedded previews smaller than this aren't a usable half-size substitute.
+_HALF_THUMB_MIN_PX = 1600
+
+def _half_from_embedded_thumb(raw) -> Optional[Image.Image]:
+    """Decode the RAW's embedded JPEG preview if it is big enough to stand in
+    for the half-size demosaic (most CR3/ARW/NEF files carry a full-size one)."""
+    try:
+        thumb = raw.extract_thumb()
+    except Exception:
+        return None
+    if getattr(thumb, 'format', None) != rawpy.ThumbFormat.JPEG:
+        return None
+    try:
+        pil = Image.open(io.BytesIO(thumb.data)); pil.load()
+    except Exception:
+        return None
+    if max(pil.size) < _HALF_THUMB_MIN_PX:
+        return None
+    try: pil = ImageOps.exif_transpose(pil)
+    except Exception: pass
+    if max(pil.size) > 2400:
+        w, h = pil.size
+        pil = pil.resize((max(1,w//2), max(1,h//2)), Image.BILINEAR)
+    return pil
+
 def load_half_pil(path: str) -> Optional[Image.Image]:
     ext = os.path.splitext(path)[1].lower()
     try:
         if ext in {'.jpg', '.jpeg'}:
-            pil = _open_jpeg_transposed(path)
+            pil = Image.open(path)
             if max(pil.size) > 2400:
+                # draft() lets libjpeg DCT-scale during decode, so we never
+                # materialize the full-resolution image just to halve it.
                 w, h = pil.size
-                pil = pil.resize((max(1,w//2), max(1,h//2)), Image.BILINEAR)
+                pil.draft('RGB', (max(1, w // 2), max(1, h // 2)))
+            pil.load()
+            try:
+                if pil.getexif().get(0x0112, 1) != 1:
+                    pil = ImageOps.exif_transpose(pil)
+            except Exception: pass
             return pil
         with _ptime(f"rawpy half postprocess {os.path.basename(path)}", warn_ms=40):
             with rawpy.imread(path) as raw:
+                pil = _half_from_embedded_thumb(raw)
+                if pil is not None:
+                    return pil
                 rgb = raw.postprocess(
                     use_camera_wb=True, no_auto_bright=True, half_size=True,
                     output_bps=8, gamma=(2.222, 4.5),
@@ -1016,21 +1278,24 @@ def load_full_pil(path: str) -> Optional[Image.Image]:
     except Exception:
         return None
 
+# Bytes per pixel by PIL mode; runs on every cache miss/eviction, so a dict
+# lookup beats building a getbands() list each call.
+_MODE_BYTES = {
+    'RGB': 3, 'RGBA': 4, 'RGBX': 4, 'CMYK': 4, 'YCbCr': 3,
+    'L': 1, 'LA': 2, 'P': 1, '1': 1,
+    'I': 4, 'F': 4, 'I;16': 2, 'I;16B': 2, 'I;16L': 2,
+}
+
 def _estimate_pil_bytes(pil: Optional[Image.Image]) -> int:
     if pil is None:
         return 0
     try:
-        w, h = pil.size
+        w = pil.width; h = pil.height
     except Exception:
         return 0
     if w <= 0 or h <= 0:
         return 0
-    try:
-        bands = len(pil.getbands())
-    except Exception:
-        bands = 3
-    bands = max(1, bands)
-    return int(w * h * bands)
+    return w * h * _MODE_BYTES.get(pil.mode, 3)
 
 def _jpeg_exif_as_meta(path: str) -> Dict[str, str]:
     meta: Dict[str, str] = {}
@@ -1051,8 +1316,114 @@ def _piexif_fallback_meta(path: str) -> Dict[str, str]:
             pass
     return meta
 
+class MetaDiskCache:
+    """Disk-backed cache of heavy EXIF metadata keyed by (path, mtime_ns, size).
+
+    Lives in the app data folder so second launches skip the rawpy/piexif
+    parses entirely for unchanged files.
+    """
+
+    def __init__(self, db_path: str):
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        try:
+            conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS meta ("
+                " path TEXT PRIMARY KEY,"
+                " mtime_ns INTEGER NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " meta TEXT NOT NULL)"
+            )
+            self._conn = conn
+        except Exception as e:
+            print(f"Warning: metadata cache unavailable: {e}")
+
+    def get(self, path: str) -> Optional[Dict[str, str]]:
+        if self._conn is None:
+            return None
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT mtime_ns, size, meta FROM meta WHERE path=?", (path,)
+                ).fetchone()
+        except Exception:
+            return None
+        if not row or row[0] != st.st_mtime_ns or row[1] != st.st_size:
+            return None
+        try:
+            meta = json.loads(row[2])
+        except Exception:
+            return None
+        return meta if isinstance(meta, dict) else None
+
+    def put(self, path: str, meta: Dict[str, str]):
+        if self._conn is None:
+            return
+        try:
+            st = os.stat(path)
+        except OSError:
+            return
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO meta (path, mtime_ns, size, meta) VALUES (?, ?, ?, ?)",
+                    (path, st.st_mtime_ns, st.st_size, json.dumps(meta, ensure_ascii=False)),
+                )
+        except Exception:
+            pass
+
+
+_META_DISK_CACHE: Optional[MetaDiskCache] = None
+_META_DISK_CACHE_LOCK = threading.Lock()
+
+
+def _meta_disk_cache() -> Optional[MetaDiskCache]:
+    global _META_DISK_CACHE
+    with _META_DISK_CACHE_LOCK:
+        if _META_DISK_CACHE is None:
+            base = QStandardPaths.writableLocation(QStandardPaths.AppDataLocation)
+            if not base:
+                return None
+            try:
+                os.makedirs(base, exist_ok=True)
+            except Exception:
+                return None
+            _META_DISK_CACHE = MetaDiskCache(os.path.join(base, "metadata.sqlite"))
+        return _META_DISK_CACHE
+
+
+def _meta_is_complete(meta: Dict[str, str]) -> bool:
+    if any(not meta.get(k) for k in ('make', 'model', 'lens', 'iso', 'fl', 'dt')):
+        return False
+    if not (meta.get('fnumber') or meta.get('fnumber_text')):
+        return False
+    if not (meta.get('exp') or meta.get('exp_text')):
+        return False
+    return True
+
+
 def _raw_meta_as_meta(path: str) -> Dict[str, str]:
+    # Try the cheap pure-Python EXIF reader first; a full LibRaw header parse
+    # is only worth paying for when fields are still missing.
     meta: Dict[str, str] = {}
+    ext = _piexif_fallback_meta(path)
+    for k in ('make', 'model', 'lens', 'iso', 'fl', 'dt'):
+        if ext.get(k):
+            meta[k] = ext[k]
+    if ext.get('fnumber_text'):
+        meta['fnumber_text'] = ext['fnumber_text']
+    if ext.get('exp_text'):
+        meta['exp_text'] = ext['exp_text']
+    if _meta_is_complete(meta):
+        return meta
+
     try:
         with _ptime(f"raw meta read {os.path.basename(path)}", warn_ms=40):
             with rawpy.imread(path) as raw:
@@ -1066,13 +1437,17 @@ def _raw_meta_as_meta(path: str) -> Dict[str, str]:
                     iso   = getattr(m, 'iso_speed', None) or getattr(m, 'iso', None)
                     fl    = getattr(m, 'focal_length', None)
                     ts    = getattr(m, 'timestamp', None)
-                    if make:  meta['make']  = str(make)
-                    if model: meta['model'] = str(model)
-                    if lens:  meta['lens']  = str(lens)
-                    if fno and float(fno) > 0:   meta['fnumber'] = f"{float(fno):.1f}"
-                    if exp and float(exp) > 0:   meta['exp'] = f"{float(exp):.6f}".rstrip('0').rstrip('.')
-                    if iso and float(iso) > 0:   meta['iso'] = str(int(float(iso)))
-                    if fl  and float(fl)  > 0:   meta['fl']  = f"{float(fl):g}mm"
+                    if make and not meta.get('make'):   meta['make']  = str(make)
+                    if model and not meta.get('model'): meta['model'] = str(model)
+                    if lens and not meta.get('lens'):   meta['lens']  = str(lens)
+                    if fno and float(fno) > 0 and not meta.get('fnumber'):
+                        meta['fnumber'] = f"{float(fno):.1f}"
+                    if exp and float(exp) > 0 and not meta.get('exp'):
+                        meta['exp'] = f"{float(exp):.6f}".rstrip('0').rstrip('.')
+                    if iso and float(iso) > 0 and not meta.get('iso'):
+                        meta['iso'] = str(int(float(iso)))
+                    if fl and float(fl) > 0 and not meta.get('fl'):
+                        meta['fl']  = f"{float(fl):g}mm"
                     if ts:
                         try:
                             meta.setdefault('dt', datetime.fromtimestamp(int(ts)).strftime('%Y-%m-%d %H:%M:%S'))
@@ -1090,14 +1465,6 @@ def _raw_meta_as_meta(path: str) -> Dict[str, str]:
                     pass
     except Exception:
         pass
-    ext = _piexif_fallback_meta(path)
-    for k in ('make','model','lens','iso','fl','dt'):
-        if not meta.get(k) and ext.get(k):
-            meta[k] = ext[k]
-    if ext.get('fnumber_text'):
-        meta['fnumber_text'] = ext['fnumber_text']
-    if ext.get('exp_text'):
-        meta['exp_text'] = ext['exp_text']
     return meta
 
 @dataclass
@@ -1109,12 +1476,26 @@ class Photo:
     rating: int = 0
     color_label: str = ""
     
-    xmp_loaded: bool = False  
-    is_dirty: bool = False    
-    is_saving: bool = False   
-    version: int = 0          
-    saving_version: int = 0   
+    xmp_loaded: bool = False
+    is_dirty: bool = False
+    # Last (rating, color_label, selected) tuple known to be on disk; lets
+    # the autosave skip sidecar writes when edits cancelled out.
+    persisted_state: Optional[Tuple] = field(default=None, repr=False, compare=False)
+    is_saving: bool = False
+    version: int = 0
+    saving_version: int = 0
     lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+    catalog: Optional["Catalog"] = field(default=None, repr=False, compare=False)
+    catalog_index: int = -1
+
+    def sync_catalog_arrays(self):
+        """Write rating/selected through to the catalog's SoA mirrors.
+
+        Call whenever those fields change (callers hold self.lock)."""
+        cat = self.catalog
+        if cat is not None and self.catalog_index >= 0:
+            cat.ratings[self.catalog_index] = self.rating
+            cat.selected[self.catalog_index] = self.selected
 
     def update_xmp(self, data: Dict):
         """Update the in-memory state and set the dirty flag."""
@@ -1133,34 +1514,55 @@ class Photo:
             if changed:
                 self.version += 1
                 self.is_dirty = True
+                self.sync_catalog_arrays()
 
 class Catalog:
     def __init__(self, root: str):
         self.root = root
         self.photos: List[Photo] = []
+        self.xmp_stats: Dict[str, os.stat_result] = {}
+        # SoA mirrors of the per-Photo fields scanned by hot UI paths; kept in
+        # sync via Photo.sync_catalog_arrays().
+        self.timestamps_ns = np.empty(0, dtype=np.int64)
+        self.ratings = np.zeros(0, dtype=np.int8)
+        self.selected = np.zeros(0, dtype=bool)
         self._index()
 
-    def _iter_files(self):
+    def _scan_entries(self) -> Tuple[List[os.DirEntry], Dict[str, os.stat_result]]:
+        """One scandir pass: RAW entries plus stat results for the sidecars."""
+        raw_entries: List[os.DirEntry] = []
+        xmp_stats: Dict[str, os.stat_result] = {}
         try:
             with os.scandir(self.root) as it:
                 for entry in it:
                     try:
+                        # DirEntry answers from scandir's d_type for regular
+                        # files and only stats actual symlinks.
                         if not entry.is_file():
                             continue
                     except OSError:
                         continue
                     ext = os.path.splitext(entry.name)[1].lower()
                     if ext in SUPPORTED_EXTS:
-                        yield entry
+                        raw_entries.append(entry)
+                    elif ext == '.xmp':
+                        try:
+                            xmp_stats[entry.path] = entry.stat()
+                        except OSError:
+                            pass
         except FileNotFoundError:
             print(f"Warning: Directory not found: {self.root}")
-            return
+        return raw_entries, xmp_stats
+
+    def sidecar_stat(self, path: str) -> Optional[os.stat_result]:
+        """Scan-time stat of the sidecar paired with `path`, if one was seen."""
+        return self.xmp_stats.get(os.path.splitext(path)[0] + '.xmp')
 
     @staticmethod
     def _entry_to_item(entry) -> Optional[Tuple[datetime, str, int]]:
         path = entry.path
         try:
-            st = entry.stat(follow_symlinks=False)
+            st = entry.stat()
         except Exception:
             st = None
         dt = read_exif_datetime(path, st)
@@ -1192,12 +1594,11 @@ class Catalog:
             progress.show()
             QApplication.processEvents()
 
-        total = 0
-        for total, _ in enumerate(self._iter_files(), start=1):
-            if progress and progress.maximum() == 0:
-                progress.setLabelText(f"Indexing photos… ({total} files found)")
-                if total % 25 == 0:
-                    QApplication.processEvents()
+        entries, self.xmp_stats = self._scan_entries()
+        total = len(entries)
+        if progress and total:
+            progress.setLabelText(f"Indexing photos… ({total} files found)")
+            QApplication.processEvents()
 
         if total == 0:
             if progress:
@@ -1206,6 +1607,7 @@ class Catalog:
                 QApplication.processEvents()
                 progress.close()
             self.photos = []
+            self._init_arrays([])
             return
 
         if progress:
@@ -1214,7 +1616,7 @@ class Catalog:
             QApplication.processEvents()
 
         processed = 0
-        for entry in self._iter_files():
+        for entry in entries:
             item = self._entry_to_item(entry)
             if item is not None:
                 items.append(item)
@@ -1226,17 +1628,80 @@ class Catalog:
                 if processed % 25 == 0 or processed == total:
                     QApplication.processEvents()
 
-        items.sort(key=lambda x: x[0])
+        items.sort(key=itemgetter(0))
 
         if progress:
             progress.close()
 
-        self.photos = [Photo(path=p, timestamp=dt, filesize=sz) for dt, p, sz in items]
+        # Intern the paths: they key every hot cache/pending-task dict, and
+        # interned keys hit the pointer-compare fast path on lookup instead
+        # of a full string comparison.
+        self.photos = [
+            Photo(path=sys.intern(p), timestamp=dt, filesize=sz, catalog=self, catalog_index=i)
+            for i, (dt, p, sz) in enumerate(items)
+        ]
+        self._init_arrays(items)
+
+    def _init_arrays(self, items: List[Tuple[datetime, str, int]]):
+        n = len(items)
+        self.timestamps_ns = np.array(
+            [int(dt.timestamp() * 1e9) for dt, _, _ in items], dtype=np.int64
+        ) if n else np.empty(0, dtype=np.int64)
+        self.ratings = np.zeros(n, dtype=np.int8)
+        self.selected = np.zeros(n, dtype=bool)
+
+    def selected_indices(self) -> List[int]:
+        return [int(i) for i in np.nonzero(self.selected)[0]]
 
     def total_photos(self) -> int:
         return len(self.photos)
 
+
+if numba is not None:
+    @numba.njit(cache=True, parallel=True, boundscheck=False)
+    def _classify_hilo_jit(gray, out):
+        """One-pass shadow/highlight classification for very large ROIs."""
+        flat_g = gray.ravel()
+        flat_o = out.ravel()
+        for i in numba.prange(flat_g.size):
+            g = flat_g[i]
+            v = 0
+            if g <= 4:
+                v |= 1
+            if g >= 251:
+                v |= 2
+            flat_o[i] = v
+else:
+    _classify_hilo_jit = None
+
+
+def _build_tonemap_lut(gamma: float = 0.6) -> list:
+    """256-entry luma LUT for the faux-HDR preview (S-curve around mid-grey)."""
+    x = np.arange(256, dtype=np.float32) / 255.0
+    lo = 0.5 * np.power(x / 0.5, gamma)
+    hi = 1.0 - 0.5 * np.power((1.0 - x) / 0.5, gamma)
+    lut = np.where(x <= 0.5, lo, hi)
+    return (lut * 255.0).astype(np.uint8).tolist()
+
+
 class ImageView(QLabel):
+    # Stripe masks keyed by (H, W, phase); with period 16 there are only 16
+    # phases per shape, so zebra animation cycles through cached masks.
+    _stripe_cache: OrderedDict = OrderedDict()
+    _STRIPE_CACHE_LIMIT = 32
+
+    # Zebra colors packed as little-endian RGBA words (A<<24|B<<16|G<<8|R) so
+    # one uint32 store writes a whole pixel.
+    _ZEBRA_HI   = np.uint32(0xFF2727FF)  # (255, 39, 39, 255)
+    _ZEBRA_LO   = np.uint32(0xFFFF4B4B)  # (75, 75, 255, 255)
+    _ZEBRA_BOTH = np.uint32(0xB4FF00FF)  # (255, 0, 255, 180)
+
+    # Clipping classification LUT: 0=neither, 1=shadow (<=4), 2=highlight
+    # (>=251), so one gather replaces two comparisons over the gray ROI.
+    _HILO_LUT = np.zeros(256, dtype=np.uint8)
+    _HILO_LUT[:5] = 1
+    _HILO_LUT[251:] = 2
+
     def __init__(self):
         super().__init__()
         self.setAlignment(Qt.AlignCenter)
@@ -1247,6 +1712,8 @@ class ImageView(QLabel):
         self._selected: bool = False
         self._mode: str = 'fit'
         self._zoom: float = 1.0
+        self._inv_zoom: float = 1.0
+        self._base_size: Tuple[int, int] = (0, 0)
         self._top_left: QPoint = QPoint(0, 0)
         self._dragging: bool = False
         self._drag_start: Optional[QPoint] = None
@@ -1264,11 +1731,26 @@ class ImageView(QLabel):
         self._zebra_timer.setInterval(60)
         self._zebra_timer.timeout.connect(self._advance_zebra_phase)
         self._hist_cache: Optional[np.ndarray] = None
+        self._hist_heights: Optional[np.ndarray] = None
         self.setAttribute(Qt.WA_OpaquePaintEvent, True)
         self._overlay_cache: Optional[Dict] = None
         self._pil_half: Optional[Image.Image] = None
         self._pil_base: Optional[Image.Image] = None
         self._hdr_lut = None
+        self._scaled_cache: Optional[Tuple[Tuple[int, int, int], QPixmap]] = None
+        self._resize_pending: bool = False
+        # Device-pixel target size memo; invalidated by resizeEvent and read
+        # by the owning widget so rapid navigation skips the Qt geometry calls.
+        self._target_size_cache: Optional[QSize] = None
+        self._geom_cache_key: Optional[tuple] = None
+        self._geom_cache_val: Optional[Dict] = None
+        self._paint_src: Optional[Image.Image] = None
+        # Frame-rate limiter for zoom/pan: state updates land immediately but
+        # repaints are batched to one per ~vsync.
+        self._repaint_timer: QTimer = QTimer(self)
+        self._repaint_timer.setSingleShot(True)
+        self._repaint_timer.setInterval(16)
+        self._repaint_timer.timeout.connect(self.update)
 
     def set_rendered_pixmap(self, pixmap: Optional[QPixmap]):
         self._rendered_pixmap = pixmap
@@ -1295,6 +1777,7 @@ class ImageView(QLabel):
         self._pil_base = pil_full or pil_half
         new_base = self._pil_base
         new_base_size = new_base.size if new_base else None
+        self._base_size = new_base_size or (0, 0)
 
         if self._mode == 'zoom' and old_base_size and new_base_size and old_base_size != new_base_size:
             old_w, old_h = old_base_size
@@ -1315,10 +1798,11 @@ class ImageView(QLabel):
                 new_top_left_x = view_center.x() - new_img_point_x * new_zoom
                 new_top_left_y = view_center.y() - new_img_point_y * new_zoom
 
-                self._zoom = new_zoom
+                self._set_zoom(new_zoom)
                 self._top_left = QPoint(int(round(new_top_left_x)), int(round(new_top_left_y)))
 
         self._hist_cache = None
+        self._hist_heights = None
         self._overlay_cache = None
 
     def _advance_zebra_phase(self):
@@ -1363,11 +1847,18 @@ class ImageView(QLabel):
         if self.show_hdr == enabled:
             return
         self.show_hdr = enabled
+        if enabled and self._hdr_lut is None:
+            self._hdr_lut = _build_tonemap_lut()
         self.update()
         
+    def _set_zoom(self, value: float):
+        self._zoom = value
+        # Reciprocal cached so per-paint geometry uses multiplies, not divides.
+        self._inv_zoom = 1.0 / value if value else 1.0
+
     def set_fit(self):
         self._mode = 'fit'
-        self._zoom = 1.0
+        self._set_zoom(1.0)
         self._top_left = QPoint(0, 0)
         self._apply_deferred_wheel()
         self.update()
@@ -1380,6 +1871,16 @@ class ImageView(QLabel):
 
     def resizeEvent(self, ev):
         super().resizeEvent(ev)
+        self._target_size_cache = None
+        if self._src_pix() is not None and self._mode == 'fit':
+            # Coalesce resize bursts (window drags fire these at 60 Hz) so
+            # only the last event in the burst pays for the resample.
+            if not self._resize_pending:
+                self._resize_pending = True
+                QTimer.singleShot(0, self._flush_resize)
+
+    def _flush_resize(self):
+        self._resize_pending = False
         if self._src_pix() is not None and self._mode == 'fit':
             self._update_scaled()
 
@@ -1395,16 +1896,22 @@ class ImageView(QLabel):
         target_w_px = max(1, int(area.width() * dpr))
         target_h_px = max(1, int(area.height() * dpr))
 
-        with _ptime(
-            f"pm.scaled target={target_w_px}x{target_h_px}",
-            warn_ms=10,
-        ):
-            pm2 = pm.scaled(
-                QSize(target_w_px, target_h_px),
-                Qt.KeepAspectRatio,
-                Qt.SmoothTransformation,
-            )
-            pm2.setDevicePixelRatio(dpr)
+        cache_key = (pm.cacheKey(), target_w_px, target_h_px)
+        cached = self._scaled_cache
+        if cached is not None and cached[0] == cache_key:
+            pm2 = cached[1]
+        else:
+            with _ptime(
+                f"pm.scaled target={target_w_px}x{target_h_px}",
+                warn_ms=10,
+            ):
+                pm2 = pm.scaled(
+                    QSize(target_w_px, target_h_px),
+                    Qt.KeepAspectRatio,
+                    Qt.SmoothTransformation,
+                )
+                pm2.setDevicePixelRatio(dpr)
+            self._scaled_cache = (cache_key, pm2)
 
         disp_w = max(1, int(round(pm2.width() / dpr)))
         disp_h = max(1, int(round(pm2.height() / dpr)))
@@ -1420,24 +1927,36 @@ class ImageView(QLabel):
         if pil is None: return
         if self._hist_cache is None:
             with _ptime("histogram compute (lazy, 512 cap)", warn_ms=12):
-                pil_small = pil.convert('L')
-                maxdim = max(pil_small.size)
-                if maxdim > 512:
-                    scale = 512.0 / maxdim
-                    pil_small = pil_small.resize((int(pil_small.width * scale), int(pil_small.height * scale)), Image.BILINEAR)
-                gray = np.array(pil_small, dtype=np.uint8)
-                hist, _ = np.histogram(gray, bins=256, range=(0, 255))
+                w, h = pil.size
+                scale = min(1.0, 512.0 / max(w, h, 1))
+                pil_small = pil
+                if scale < 1.0:
+                    # Downsample before the L-conversion; NEAREST is plenty for
+                    # histogram sampling.
+                    pil_small = pil.resize(
+                        (max(1, int(w * scale)), max(1, int(h * scale))), Image.NEAREST
+                    )
+                gray = np.asarray(pil_small.convert('L'), dtype=np.uint8)
+                hist = np.bincount(gray.ravel(), minlength=256)
                 self._hist_cache = hist
+                maxv = max(1, int(hist.max()))
+                # Bar heights scale with the data only; cache them with the hist.
+                self._hist_heights = (
+                    hist[:256].astype(np.float32) * (80.0 / maxv)
+                ).astype(np.int32)
         h_img, w_img = 80, 256
         r = self.rect()
         x0 = r.right() - w_img - 14
         y0 = r.top() + 14
-        maxv = max(1, int(self._hist_cache.max()))
         painter.fillRect(QRect(x0-4, y0-4, w_img+8, h_img+8), QColor(0,0,0,160))
         painter.setPen(QPen(theme_qcolor('text.primary')))
-        for x in range(w_img):
-            v = int(self._hist_cache[x] / maxv * h_img)
-            painter.drawLine(x0 + x, y0 + h_img, x0 + x, y0 + h_img - v)
+        heights = self._hist_heights
+        base_y = y0 + h_img
+        lines = [
+            QLine(x0 + x, base_y, x0 + x, base_y - int(heights[x]))
+            for x in range(w_img)
+        ]
+        painter.drawLines(lines)
 
     def _visible_geometry(self, src_pil: Optional[Image.Image] = None):
         base = self._pil_base or src_pil or self._pil_full or self._pil_half
@@ -1445,7 +1964,22 @@ class ImageView(QLabel):
         if base is None or src is None:
             return None
 
-        base_w, base_h = base.width, base.height
+        # paintEvent and _draw_overlays both call this per repaint; memoize
+        # on the full set of inputs so unchanged view state is a dict lookup.
+        geom_key = (
+            id(base), id(src), src.size,
+            self.width(), self.height(), self._mode,
+            self._zoom, self._top_left.x(), self._top_left.y(),
+            self._pm_rect.x(), self._pm_rect.y(),
+            self._pm_rect.width(), self._pm_rect.height(),
+        )
+        if geom_key == self._geom_cache_key:
+            return self._geom_cache_val
+
+        if base is self._pil_base and self._base_size != (0, 0):
+            base_w, base_h = self._base_size
+        else:
+            base_w, base_h = base.width, base.height
         if base_w <= 0 or base_h <= 0 or src.width <= 0 or src.height <= 0:
             return None
 
@@ -1462,19 +1996,21 @@ class ImageView(QLabel):
                 x = area.x() + (area.width() - disp_w) // 2
                 y = area.y() + (area.height() - disp_h) // 2
                 pm_rect = QRect(x, y, disp_w, disp_h)
+            inv_s = 1.0 / s if s else 1.0
         else:
-            pm_rect = QRect(self._top_left, QSize(int(base_w * self._zoom), int(base_h * self._zoom)))
             s = self._zoom
+            inv_s = self._inv_zoom
+            pm_rect = QRect(self._top_left, QSize(int(base_w * s), int(base_h * s)))
 
         area = self.rect()
         vis = pm_rect.intersected(area)
         if not vis.isValid():
             return None
 
-        sx = (vis.left() - pm_rect.left()) / s
-        sy = (vis.top()  - pm_rect.top())  / s
-        sw = vis.width()  / s
-        sh = vis.height() / s
+        sx = (vis.left() - pm_rect.left()) * inv_s
+        sy = (vis.top()  - pm_rect.top())  * inv_s
+        sw = vis.width()  * inv_s
+        sh = vis.height() * inv_s
 
         sx = max(0.0, min(sx, base_w))
         sy = max(0.0, min(sy, base_h))
@@ -1490,9 +2026,10 @@ class ImageView(QLabel):
             int(round((sy + sh) * scale_y)),
         )
 
-        return {
+        geom = {
             "pm_rect": pm_rect,
             "target": QRectF(vis),
+            "target_int": QRect(vis),
             "src_pil": pil_box,
             "scale": s,
             "base_w": base_w,
@@ -1500,6 +2037,9 @@ class ImageView(QLabel):
             "src_w": src.width,
             "src_h": src.height,
         }
+        self._geom_cache_key = geom_key
+        self._geom_cache_val = geom
+        return geom
 
     def paintEvent(self, ev):
         painter = QPainter(self)
@@ -1545,28 +2085,22 @@ class ImageView(QLabel):
                         tgt = geom["target"]
                         box = geom["src_pil"]
                         dpr = painter.device().devicePixelRatioF()
+                        target_qrect = geom["target_int"]
                         if self._mode == 'fit':
-                            self._pm_rect = QRect(int(tgt.x()), int(tgt.y()), int(tgt.width()), int(tgt.height()))
-
-                        target_qrect = QRect(int(tgt.x()), int(tgt.y()), int(tgt.width()), int(tgt.height()))
+                            self._pm_rect = QRect(target_qrect)
                         painter.fillRect(target_qrect, photo_brush)
 
                         quality_scaler = 1.0
                         tw = max(1, int(tgt.width() * dpr * quality_scaler))
                         th = max(1, int(tgt.height() * dpr * quality_scaler))
 
-                        resize_filter = Image.BILINEAR
-                        roi = src.crop(box).resize((tw, th), resize_filter)
+                        # box= fuses the crop into the resample, skipping the
+                        # intermediate full-crop allocation.
+                        roi = src.resize((tw, th), Image.BILINEAR, box=box)
 
                         if self.show_hdr:
                             if self._hdr_lut is None:
-                                gamma = 0.6
-                                lut_array = np.zeros(256, dtype=np.float32)
-                                for i in range(256):
-                                    x = i / 255.0
-                                    if x <= 0.5: lut_array[i] = 0.5 * pow(x / 0.5, gamma)
-                                    else: lut_array[i] = 1.0 - 0.5 * pow((1.0 - x) / 0.5, gamma)
-                                self._hdr_lut = (lut_array * 255.0).astype(np.uint8).tolist()
+                                self._hdr_lut = _build_tonemap_lut()
 
                             ycbcr = roi.convert('YCbCr')
                             y, cb, cr = ycbcr.split()
@@ -1579,8 +2113,12 @@ class ImageView(QLabel):
                         print(f"Error during temporary paint: {e}")
 
 
+        # Resolve the overlay source once per paint pass; _draw_overlays picks
+        # it up instead of re-walking the PIL chain.
+        self._paint_src = self._pick_src_pil() if self.show_zebra else None
         self._draw_overlays(painter)
         self._draw_histogram_overlay(painter)
+        self._paint_src = None
 
         if self.loading:
             painter.fillRect(self.rect(), QColor(0, 0, 0, 120))
@@ -1588,7 +2126,12 @@ class ImageView(QLabel):
             painter.drawText(self.rect(), Qt.AlignCenter, "Loading…")
                
     def _draw_overlays(self, painter: QPainter):
-        src = self._pick_src_pil()
+        need_zebra = self.show_zebra
+        need_peaking = False
+        if not (need_zebra or need_peaking):
+            return
+
+        src = self._paint_src if self._paint_src is not None else self._pick_src_pil()
         if src is None:
             return
         geom = self._visible_geometry(src_pil=src)
@@ -1600,12 +2143,9 @@ class ImageView(QLabel):
         if tw < 2 or th < 2:
             return
 
-        need_zebra = self.show_zebra
-        need_peaking = False
-        if not (need_zebra or need_peaking):
-            return
-
-        down = 1
+        # Masks are perceptually coarse (16 px stripes), so large targets can
+        # compute them at half resolution for a quarter of the bandwidth.
+        down = 2 if max(tw, th) > 1200 else 1
 
         ds_w = max(1, tw // down); ds_h = max(1, th // down)
 
@@ -1614,35 +2154,79 @@ class ImageView(QLabel):
 
         if not self._overlay_cache or self._overlay_cache.get("key") != roi_key:
             with _ptime(f"overlay ROI prepare {ds_w}x{ds_h}", warn_ms=5):
-                roi_for_mask = src.crop(box).resize((ds_w, ds_h), Image.NEAREST)
+                roi_for_mask = src.resize((ds_w, ds_h), Image.NEAREST, box=tuple(box))
 
             with _ptime("overlay mask compute(gray+hi/lo)", warn_ms=6):
-                gray_pil = roi_for_mask.convert('L')
-                gray_arr = np.array(gray_pil, dtype=np.uint8)
-                
+                rgb = np.asarray(roi_for_mask)
+                if rgb.ndim == 3 and rgb.shape[2] >= 3:
+                    # Integer Rec.601 luma straight off the RGB bytes: one
+                    # pass, no intermediate 'L' image allocation.
+                    rgb16 = rgb.astype(np.uint16)
+                    gray_arr = ((rgb16[..., 0] * 77 + rgb16[..., 1] * 150
+                                 + rgb16[..., 2] * 29) >> 8).astype(np.uint8)
+                else:
+                    gray_arr = np.array(roi_for_mask.convert('L'), dtype=np.uint8)
+
                 cache = {"key": roi_key, "shape": gray_arr.shape}
-                cache["mask_hi"] = (gray_arr >= 251)
-                cache["mask_lo"] = (gray_arr <= 4)
+                if _classify_hilo_jit is not None and gray_arr.size >= 1_000_000:
+                    hilo = np.empty_like(gray_arr)
+                    _classify_hilo_jit(gray_arr, hilo)
+                    cache["hilo"] = hilo
+                else:
+                    cache["hilo"] = ImageView._HILO_LUT[gray_arr]
                 self._overlay_cache = cache
 
         H, W = self._overlay_cache["shape"][:2]
-        overlay = np.zeros((H, W, 4), dtype=np.uint8)
-        if need_zebra:
-            yy, xx = np.indices((H, W))
-            period = 16; duty = 8; phase = self._zebra_phase
-            stripe = ((xx + yy + phase) % period) < duty
-            mh = self._overlay_cache["mask_hi"]
-            ml = self._overlay_cache["mask_lo"]
-            overlay[mh & stripe] = [255, 39, 39, 255]
-            overlay[(ml & stripe) & ~mh] = [75, 75, 255, 255]
-            overlay[(ml & mh) & stripe]  = [255, 0, 255, 180]
-
-        if overlay.any():
-            with _ptime("overlay compose+draw", warn_ms=8):
-                ov_img_small = Image.fromarray(overlay, mode='RGBA')
-                ov_img = ov_img_small.resize((tw, th), Image.NEAREST)
-                qimg = ImageQt.ImageQt(ov_img)
-                painter.drawImage(tgt, qimg)
+        period = 16; duty = 8
+        phase = int(self._zebra_phase) % period if need_zebra else -1
+
+        # Rendered QImages keyed by (phase, tw, th); the roi_key is implicit
+        # since _overlay_cache is rebuilt whenever it changes. 16 phases cover
+        # a full zebra cycle, so animation repaints skip the compose entirely.
+        qimgs = self._overlay_cache.setdefault("qimg_by_phase", {})
+        qkey = (phase, tw, th)
+        if qkey in qimgs:
+            entry = qimgs[qkey]
+        else:
+            ov32 = np.zeros((H, W), dtype=np.uint32)
+            if need_zebra:
+                stripe_key = (H, W, phase)
+                stripe = ImageView._stripe_cache.get(stripe_key)
+                if stripe is None:
+                    # Broadcasted aranges instead of np.indices: no H×W int64
+                    # coordinate arrays, just one fused pass for the stripe mask.
+                    diag = (np.arange(W, dtype=np.int32)[None, :]
+                            + np.arange(H, dtype=np.int32)[:, None])
+                    stripe = ((diag + phase) % period) < duty
+                    ImageView._stripe_cache[stripe_key] = stripe
+                    while len(ImageView._stripe_cache) > ImageView._STRIPE_CACHE_LIMIT:
+                        ImageView._stripe_cache.popitem(last=False)
+                else:
+                    ImageView._stripe_cache.move_to_end(stripe_key)
+                # stripe is bool, so the multiply zeroes non-stripe lanes and
+                # leaves the 1/2/3 classification on striped pixels.
+                sel = self._overlay_cache["hilo"] * stripe
+                ov32[sel == 2] = ImageView._ZEBRA_HI
+                ov32[sel == 1] = ImageView._ZEBRA_LO
+                ov32[sel == 3] = ImageView._ZEBRA_BOTH
+
+            entry = None
+            if ov32.any():
+                with _ptime("overlay compose+draw", warn_ms=8):
+                    # QImage wraps the numpy buffer directly; the array is
+                    # kept in the cache entry so it outlives the draw, and
+                    # drawImage scales the small image into tgt itself.
+                    buf = ov32.view(np.uint8).reshape(H, W, 4)
+                    entry = (
+                        QImage(buf.data, W, H, W * 4, QImage.Format_RGBA8888),
+                        ov32,
+                    )
+            if len(qimgs) >= period:
+                qimgs.clear()
+            qimgs[qkey] = entry
+
+        if entry is not None:
+            painter.drawImage(tgt, entry[0])
 
     def wheelEvent(self, e):
         pm = self._src_pix()
@@ -1663,7 +2247,7 @@ class ImageView(QLabel):
             else:
                 s_fit = 1.0
 
-            self._zoom = max(0.01, s_fit)
+            self._set_zoom(max(0.01, s_fit))
             area = self.rect()
             if base:
                 img_w = int(base.width * self._zoom)
@@ -1689,12 +2273,16 @@ class ImageView(QLabel):
 
         u_img_x = (c.x() - T_old.x()) / s_old
         u_img_y = (c.y() - T_old.y()) / s_old
-        self._zoom = new_zoom
+        self._set_zoom(new_zoom)
         T_new_x = int(c.x() - u_img_x * self._zoom)
         T_new_y = int(c.y() - u_img_y * self._zoom)
         self._top_left = QPoint(T_new_x, T_new_y)
         self._overlay_cache = None
-        self.update()
+        self._request_repaint()
+
+    def _request_repaint(self):
+        if not self._repaint_timer.isActive():
+            self._repaint_timer.start()
 
     def _apply_deferred_wheel(self):
         if not self._wheel_queue or (self._src_pix() is None and self._pil_base is None):
@@ -1709,7 +2297,7 @@ class ImageView(QLabel):
             else:
                 s_fit = 1.0
 
-            self._zoom = max(0.01, s_fit)
+            self._set_zoom(max(0.01, s_fit))
             area = self.rect()
             if base:
                 img_w = int(base.width * self._zoom)
@@ -1728,18 +2316,30 @@ class ImageView(QLabel):
 
         steps = self._wheel_queue
         self._wheel_queue = 0
-        step_unit = 1 if steps > 0 else -1
-
-        for _ in range(abs(steps)):
-            factor = 1.25 ** step_unit
-            s_old = self._zoom
-            T_old = self._top_left
-            u_img_x = (c.x() - T_old.x()) / s_old
-            u_img_y = (c.y() - T_old.y()) / s_old
-            self._zoom = min(12.0, max(0.05, self._zoom * factor))
-            T_new_x = int(c.x() - u_img_x * self._zoom)
-            T_new_y = int(c.y() - u_img_y * self._zoom)
-            self._top_left = QPoint(T_new_x, T_new_y)
+
+        # N composed 1.25-steps around a fixed anchor equal one 1.25**N step,
+        # so the coalesced flick collapses to a single update unless the zoom
+        # clamp would bite partway through the sequence.
+        s_old = self._zoom
+        target = s_old * (1.25 ** steps)
+        if 0.05 <= target <= 12.0:
+            u_img_x = (c.x() - self._top_left.x()) / s_old
+            u_img_y = (c.y() - self._top_left.y()) / s_old
+            self._set_zoom(target)
+            self._top_left = QPoint(int(c.x() - u_img_x * target),
+                                    int(c.y() - u_img_y * target))
+        else:
+            step_unit = 1 if steps > 0 else -1
+            for _ in range(abs(steps)):
+                factor = 1.25 ** step_unit
+                s_old = self._zoom
+                T_old = self._top_left
+                u_img_x = (c.x() - T_old.x()) / s_old
+                u_img_y = (c.y() - T_old.y()) / s_old
+                self._set_zoom(min(12.0, max(0.05, self._zoom * factor)))
+                T_new_x = int(c.x() - u_img_x * self._zoom)
+                T_new_y = int(c.y() - u_img_y * self._zoom)
+                self._top_left = QPoint(T_new_x, T_new_y)
 
         self._overlay_cache = None
         self.update()
@@ -1753,7 +2353,7 @@ class ImageView(QLabel):
             delta = e.pos() - self._drag_start
             self._top_left = self._top_left_start + delta
             self._overlay_cache = None
-            self.update()
+            self._request_repaint()
         super().mouseMoveEvent(e)
     def mouseReleaseEvent(self, e):
         if e.button() == Qt.LeftButton:
@@ -1776,10 +2376,14 @@ class Filmstrip(QWidget):
         self.setMinimumHeight(height)
         self.items = []
         self.rects = []
+        self._pm_cache: Dict[Tuple[str, int], QPixmap] = {}
+        self._rating_metrics_cache: Dict[Tuple[int, int], Tuple[int, int, int]] = {}
+        self._star_path_cache: Dict[Tuple[int, int], QPainterPath] = {}
         self.setMouseTracking(True)
 
     def set_items(self, items):
         self.items = items or []
+        self._pm_cache.clear()
         self.update()
 
     def paintEvent(self, ev):
@@ -1794,7 +2398,13 @@ class Filmstrip(QWidget):
 
         thumbs: List[Optional[QPixmap]] = []
         for it in self.items:
-            pm = self.loader(it['path'], h)
+            key = (it['path'], h)
+            pm = self._pm_cache.get(key)
+            if pm is None:
+                pm = self.loader(it['path'], h)
+                if pm is not None:
+                    # None means still loading — retry on the next paint.
+                    self._pm_cache[key] = pm
             thumbs.append(pm)
 
         widths = [w] * len(self.items)
@@ -1889,34 +2499,49 @@ class Filmstrip(QWidget):
             return
 
         star_str_full = "★" * rating + "☆" * (5 - rating)
-        available_width = r.width() - 4  
-
+        filled_str = "★" * rating
+        empty_str = "☆" * (5 - rating)
         font = p.font()
-        font_size = 12  
-        while font_size > 6:  
+
+        # The shrink-to-fit probe depends only on (rating, width); memoize it
+        # so scrolling repaints skip the per-thumb font-metric loop.
+        cache_key = (rating, r.width())
+        cached = self._rating_metrics_cache.get(cache_key)
+        if cached is None:
+            available_width = r.width() - 4
+            font_size = 12
+            while font_size > 6:
+                font.setPointSize(font_size)
+                p.setFont(font)
+                fm = p.fontMetrics()
+                if fm.horizontalAdvance(star_str_full) <= available_width:
+                    break
+                font_size -= 1
+            fm = p.fontMetrics()
+            filled_width = fm.horizontalAdvance(filled_str)
+            total_width = fm.horizontalAdvance(star_str_full)
+            self._rating_metrics_cache[cache_key] = (font_size, total_width, filled_width)
+        else:
+            font_size, total_width, filled_width = cached
             font.setPointSize(font_size)
             p.setFont(font)
             fm = p.fontMetrics()
-            text_width = fm.horizontalAdvance(star_str_full)
-            if text_width <= available_width:
-                break  
-            font_size -= 1
 
-        fm = p.fontMetrics()
-        
-        filled_str = "★" * rating
-        filled_width = fm.horizontalAdvance(filled_str)
-        
-        empty_str = "☆" * (5 - rating)
-        
-        total_width = fm.horizontalAdvance(filled_str + empty_str)
-        
         start_x = r.left() + (r.width() - total_width) // 2
         text_rect = QRect(start_x, r.bottom() - fm.height() - 2, total_width, fm.height())
 
         if filled_str:
-            path = QPainterPath()
-            path.addText(text_rect.left(), text_rect.top() + fm.ascent(), font, filled_str)
+            # Glyph outlining is expensive; build the path once per
+            # (rating, font size) at the origin and translate into place.
+            path_key = (rating, font_size)
+            path = self._star_path_cache.get(path_key)
+            if path is None:
+                path = QPainterPath()
+                path.addText(0, 0, font, filled_str)
+                self._star_path_cache[path_key] = path
+
+            p.save()
+            p.translate(text_rect.left(), text_rect.top() + fm.ascent())
 
             pen = QPen(theme_qcolor('border.default'), 2)
             p.setPen(pen)
@@ -1928,6 +2553,7 @@ class Filmstrip(QWidget):
             p.setPen(Qt.NoPen)
             p.drawPath(path)
             p.setBrush(Qt.NoBrush)
+            p.restore()
 
         empty_rect = QRect(text_rect.left() + filled_width, text_rect.top(), text_rect.width() - filled_width, text_rect.height())
         p.setPen(theme_qcolor('text.tertiary'))
@@ -1944,9 +2570,10 @@ class LoaderSignals(QObject):
     loaded = Signal(str, str)
     meta = Signal(str, dict)
     xmp = Signal(str, dict)
+    xmp_batch = Signal(list)
     load_failed = Signal(str, str)
-    xmp_saved = Signal(str)
-    xmp_save_failed = Signal(str)
+    xmp_saved = Signal(list)
+    xmp_save_failed = Signal(list)
     thumb_ready = Signal(str, int, object)
     resized_pixmap_ready = Signal(str, QSize, object)
 
@@ -2014,16 +2641,36 @@ class ExportWorker(QObject):
         self._cancel_requested.set()
 
     def _sync(self) -> Optional[ExportResult]:
+        def _scan_stats(folder: str) -> Dict[str, os.stat_result]:
+            stats: Dict[str, os.stat_result] = {}
+            try:
+                with os.scandir(folder) as it:
+                    for e in it:
+                        try:
+                            if e.is_file():
+                                stats[e.path] = e.stat()
+                        except OSError:
+                            continue
+            except Exception:
+                pass
+            return stats
+
+        # Filled in below (after stale files are removed); destinations are
+        # stat'd in one scandir pass per folder so _needs_copy only pays for
+        # the source-side stat.
+        dest_stats: Dict[str, os.stat_result] = {}
+
         def _needs_copy(src: str, dst: str) -> bool:
+            d = dest_stats.get(dst)
+            if d is None:
+                return True
             try:
-                s, d = os.stat(src), os.stat(dst)
+                s = os.stat(src)
                 if s.st_size != d.st_size:
                     return True
                 s_m = getattr(s, "st_mtime_ns", int(s.st_mtime * 1e9))
                 d_m = getattr(d, "st_mtime_ns", int(d.st_mtime * 1e9))
                 return s_m > d_m
-            except FileNotFoundError:
-                return True
             except Exception:
                 return True
 
@@ -2032,55 +2679,66 @@ class ExportWorker(QObject):
         raw_out_dir = os.path.join(self.root, self.raw_output_folder_name)
         jpeg_out_dir = os.path.join(self.root, self.jpeg_output_folder_name)
 
-        os.makedirs(raw_out_dir, exist_ok=True)
-        os.makedirs(jpeg_out_dir, exist_ok=True)
+        _ensure_dir(raw_out_dir)
+        _ensure_dir(jpeg_out_dir)
 
-        selected_raw_by_base = {
-            os.path.splitext(os.path.basename(p))[0]: p for p in selected_paths
-        }
-        root_jpegs_by_base = _list_paths_by_basename(self.root, {".jpg", ".jpeg"})
+        # Split each selected path once; basename/base/ext are reused by the
+        # stale sweep, the copy-task build, and the .xmp sibling names.
+        parsed_by_base: Dict[str, Tuple[str, str, str]] = {}
+        for p in selected_paths:
+            bn = os.path.basename(p)
+            base, ext = os.path.splitext(bn)
+            parsed_by_base[base] = (p, bn, ext)
+        selected_raw_by_base = {base: t[0] for base, t in parsed_by_base.items()}
+        root_jpegs_by_base = _list_paths_by_basename(self.root, _JPEG_EXTS)
 
-        dest_raw_by_base = _list_paths_by_basename(
-            raw_out_dir, SUPPORTED_EXTS.union({".xmp"})
-        )
-        dest_jpg_by_base = _list_paths_by_basename(
-            jpeg_out_dir, {".jpg", ".jpeg"}
-        )
+        dest_raw_by_base = _list_paths_by_basename(raw_out_dir, _RAW_PLUS_XMP_EXTS)
+        dest_jpg_by_base = _list_paths_by_basename(jpeg_out_dir, _JPEG_EXTS)
 
         if self._cancel_requested.is_set():
             return None
 
-        for base, dst_paths in list(dest_raw_by_base.items()):
-            if base not in selected_raw_by_base:
-                for dst_path in dst_paths:
-                    if self._cancel_requested.is_set():
-                        return None
-                    try:
-                        os.remove(dst_path)
-                    except Exception:
-                        pass
+        # Set difference at C speed instead of per-entry membership tests,
+        # and a cancel check every 64 removals rather than every one.
+        stale_raw = dest_raw_by_base.keys() - selected_raw_by_base.keys()
+        removed = 0
+        idx = 0
+        for base in stale_raw:
+            for dst_path in dest_raw_by_base[base]:
+                if idx & 63 == 0 and self._cancel_requested.is_set():
+                    return None
+                idx += 1
+                try:
+                    os.remove(dst_path)
+                    removed += 1
+                except Exception:
+                    pass
 
-        desired_jpg_bases = {
-            b for b in selected_raw_by_base if b in root_jpegs_by_base
-        }
+        desired_jpg_bases = selected_raw_by_base.keys() & root_jpegs_by_base.keys()
 
-        for base, dst_paths in list(dest_jpg_by_base.items()):
-            if base not in desired_jpg_bases:
-                for dst_path in dst_paths:
-                    if self._cancel_requested.is_set():
-                        return None
-                    try:
-                        os.remove(dst_path)
-                    except Exception:
-                        pass
+        stale_jpg = dest_jpg_by_base.keys() - desired_jpg_bases
+        idx = 0
+        for base in stale_jpg:
+            for dst_path in dest_jpg_by_base[base]:
+                if idx & 63 == 0 and self._cancel_requested.is_set():
+                    return None
+                idx += 1
+                try:
+                    os.remove(dst_path)
+                    removed += 1
+                except Exception:
+                    pass
+
+        dest_stats.update(_scan_stats(raw_out_dir))
+        dest_stats.update(_scan_stats(jpeg_out_dir))
 
         tasks: List[Tuple[str, str, str]] = []  # (src, dst, kind)
-        for base, src_path in selected_raw_by_base.items():
-            dst_path = os.path.join(raw_out_dir, os.path.basename(src_path))
+        for base, (src_path, bn, ext) in parsed_by_base.items():
+            dst_path = os.path.join(raw_out_dir, bn)
             if _needs_copy(src_path, dst_path):
                 tasks.append((src_path, dst_path, "raw"))
-            src_xmp = os.path.splitext(src_path)[0] + ".xmp"
-            dst_xmp = os.path.splitext(dst_path)[0] + ".xmp"
+            src_xmp = (src_path[:-len(ext)] if ext else src_path) + ".xmp"
+            dst_xmp = os.path.join(raw_out_dir, base + ".xmp")
             if os.path.exists(src_xmp) and _needs_copy(src_xmp, dst_xmp):
                 tasks.append((src_xmp, dst_xmp, "xmp"))
 
@@ -2097,29 +2755,54 @@ class ExportWorker(QObject):
         copied_jpg = 0
         completed = 0
 
-        for src, dst, kind in tasks:
-            if self._cancel_requested.is_set():
-                return None
-            name = os.path.basename(src)
-            self.progress.emit(completed, total_tasks, f"Copying {name}")
-            try:
-                shutil.copy2(src, dst)
-            except Exception as exc:
-                raise RuntimeError(f"Failed to copy {src} -> {dst}: {exc}") from exc
-            completed += 1
-            if kind == "raw":
-                copied_raw += 1
-            elif kind == "jpeg":
-                copied_jpg += 1
-            self.progress.emit(completed, total_tasks, f"Copied {name}")
+        # The copies are I/O-bound; running them serially leaves the drive
+        # at queue depth 1. A small pool keeps several in flight.
+        if tasks:
+            # ~200 progress signals regardless of export size; per-file
+            # emission floods the GUI event loop on big folders.
+            step = max(1, total_tasks // 200)
+            with ThreadPoolExecutor(max_workers=min(8, len(tasks))) as ex:
+                futures = {
+                    ex.submit(_copy_one, src, dst): (src, dst, kind)
+                    for src, dst, kind in tasks
+                }
+                for fut in as_completed(futures):
+                    src, dst, kind = futures[fut]
+                    if self._cancel_requested.is_set():
+                        for pending in futures:
+                            pending.cancel()
+                        return None
+                    try:
+                        fut.result()
+                    except Exception as exc:
+                        for pending in futures:
+                            pending.cancel()
+                        raise RuntimeError(f"Failed to copy {src} -> {dst}: {exc}") from exc
+                    completed += 1
+                    if kind == "raw":
+                        copied_raw += 1
+                    elif kind == "jpeg":
+                        copied_jpg += 1
+                    if completed % step == 0 or completed == total_tasks:
+                        self.progress.emit(completed, total_tasks, f"Copied {os.path.basename(src)}")
 
         if self._cancel_requested.is_set():
             return None
 
-        dest_raw_count = len(_list_paths_by_basename(raw_out_dir, SUPPORTED_EXTS))
-        dest_jpeg_count = len(
-            _list_paths_by_basename(jpeg_out_dir, {".jpg", ".jpeg"})
-        )
+        if not tasks and removed == 0:
+            # Idempotent re-export: nothing was copied or deleted, so the
+            # listings from the top of the run are still accurate and the
+            # two closing directory rescans can be skipped.
+            dest_raw_count = sum(
+                1 for paths in dest_raw_by_base.values()
+                if any(os.path.splitext(p)[1].lower() in SUPPORTED_EXTS for p in paths)
+            )
+            dest_jpeg_count = len(dest_jpg_by_base)
+        else:
+            dest_raw_count = len(_list_paths_by_basename(raw_out_dir, SUPPORTED_EXTS))
+            dest_jpeg_count = len(
+                _list_paths_by_basename(jpeg_out_dir, _JPEG_EXTS)
+            )
 
         self.progress.emit(total_tasks, total_tasks, "Export complete.")
 
@@ -2178,19 +2861,38 @@ class CullingWidget(QWidget):
         root_box.addWidget(card, 1)
 
         self.catalog = Catalog(root)
-        self._selected_count = sum(1 for p in self.catalog.photos if p.selected)
+        # Path->photo/index lookups: xmp results and filmstrip clicks arrive
+        # as paths, and scanning catalog.photos per event is O(N^2) at startup.
+        self._photo_by_path: Dict[str, Photo] = {p.path: p for p in self.catalog.photos}
+        self._photo_index_by_path: Dict[str, int] = {p.path: i for i, p in enumerate(self.catalog.photos)}
+        self._selected_count = int(self.catalog.selected.sum())
         self.idx = 0
         self.selected_view_only = False
 
-        self.pil_full_cache: OrderedDict[str, Image.Image] = OrderedDict()
-        self.pil_half_cache: OrderedDict[str, Image.Image] = OrderedDict()
-        self.resized_pixmap_cache: OrderedDict[Tuple[str, int, int], QPixmap] = OrderedDict()
+        # Plain dicts keep insertion order and beat OrderedDict.move_to_end on
+        # the touch-per-access hot path; recency refresh is pop+reinsert.
+        self.pil_full_cache: Dict[str, Image.Image] = {}
+        self.pil_half_cache: Dict[str, Image.Image] = {}
+        self.resized_pixmap_cache: Dict[Tuple[str, int, int], QPixmap] = {}
         self.cache_resized_limit = 32
         self.cache_full_limit = 32
         self.cache_half_limit = 64
         self.cache_lock = threading.Lock()
         self._cache_estimated_bytes: int = 0
         self._cache_item_sizes: Dict[Tuple[str, str], int] = {}
+        self._cache_hits: Dict[Tuple[str, str], int] = {}
+        # Hard ceiling for the PIL caches: a quarter of RAM, capped at 4 GB
+        # (2 GB fallback when psutil is unavailable).
+        budget = 2 * 1024 ** 3
+        if psutil is not None:
+            try:
+                budget = min(int(psutil.virtual_memory().total * 0.25), 4 * 1024 ** 3)
+            except Exception:
+                pass
+        self._cache_byte_budget: int = budget
+        self._vm_cache = None
+        self._vm_cache_ts: float = 0.0
+        self._vm_sample_bytes: int = 0
         self._pm_thumb_cache: Dict[Tuple[str,int], QPixmap] = {}
         self._pm_thumb_limit = 256
         self._load_failures: set[str] = set()
@@ -2199,37 +2901,45 @@ class CullingWidget(QWidget):
         self.signals.loaded.connect(self._on_loaded)
         self.signals.meta.connect(self._on_meta_ready)
         self.signals.xmp.connect(self._on_xmp_ready)
+        self.signals.xmp_batch.connect(self._on_xmp_batch)
         self.signals.load_failed.connect(self._on_load_failed)
         self.signals.xmp_saved.connect(self._on_xmp_saved)
         self.signals.xmp_save_failed.connect(self._on_xmp_save_failed)
         self.signals.thumb_ready.connect(self._on_thumb_ready)
         self.signals.resized_pixmap_ready.connect(self._on_resized_pixmap_ready)
 
-        self._taskq: PriorityQueue = PriorityQueue()
         self._task_counter = 0
+        self._dispatch_counter = itertools.count()
         self._loader_stop = False
         default_workers = max(2, min(32, (os.cpu_count() or 4) - 1))
         self._num_workers = int(workers) if (workers and workers > 0) else default_workers
+        # One task-queue shard per worker so bursts of tiny tasks don't
+        # serialize every put/get on a single mutex. Workers drain their own
+        # shard first and steal from the rest when it runs dry.
+        self._taskqs: List[PriorityQueue] = [PriorityQueue() for _ in range(self._num_workers)]
         self._loader_threads: List[threading.Thread] = []
         for i in range(self._num_workers):
-            t = threading.Thread(target=self._loader_loop, daemon=True, name=f"loader-{i}")
+            t = threading.Thread(target=self._loader_loop, args=(i,), daemon=True, name=f"loader-{i}")
             t.start(); self._loader_threads.append(t)
 
         self._full_lock = threading.Lock()
+        self._full_cv = threading.Condition(self._full_lock)
         self._full_running = 0
 
         self.selections_path = os.path.join(root, 'selections.json')
         self._load_selections() 
 
         self.autosave_timer = QTimer(self); self.autosave_timer.setSingleShot(True)
+        self._autosave_first_dirty_ts: Optional[float] = None
         self.autosave_interval_timer = QTimer(self)
         self.update_autosave_interval()
         self.autosave_timer.timeout.connect(self.save_all_dirty_files)
         self.autosave_interval_timer.timeout.connect(self.save_all_dirty_files)
         self.autosave_interval_timer.start()
 
-        self._pending_tasks = set()
-        self._pending_lock = threading.Lock()
+        # Dict instead of set so registration is a single atomic setdefault;
+        # membership, pop and clear are likewise atomic per-op, so no lock.
+        self._pending_tasks: Dict[Tuple, object] = {}
 
 
         self._schedule_timer = QTimer(self); self._schedule_timer.setSingleShot(True)
@@ -2244,6 +2954,8 @@ class CullingWidget(QWidget):
 
         self._last_input_ts = 0.0
         self._meta_cache: Dict[str, Dict[str,str]] = {}
+        self._mtime_str_cache: Dict[str, str] = {}
+        self._last_meta_digest: Optional[int] = None
 
         self.zebra_toggled = False
         self.hdr_toggled = False
@@ -2304,6 +3016,21 @@ class CullingWidget(QWidget):
     def update_autosave_interval(self):
         self.autosave_interval_timer.setInterval(self.settings.autosave_interval_min * 60 * 1000)
 
+    AUTOSAVE_DEBOUNCE_MS = 1500
+    AUTOSAVE_MAX_DELAY_S = 10.0
+
+    def _schedule_autosave(self):
+        """Debounce dirty-metadata flushes so a burst of rating/label edits
+        results in one write per photo, but never let an unbroken burst push
+        the flush out past AUTOSAVE_MAX_DELAY_S."""
+        now = time.monotonic()
+        if self._autosave_first_dirty_ts is None:
+            self._autosave_first_dirty_ts = now
+        elif now - self._autosave_first_dirty_ts >= self.AUTOSAVE_MAX_DELAY_S:
+            self.save_all_dirty_files()
+            return
+        self.autosave_timer.start(self.AUTOSAVE_DEBOUNCE_MS)
+
     def _create_actions(self):
         self.actions: Dict[str, QAction] = {}
         action_map = {
@@ -2392,7 +3119,7 @@ class CullingWidget(QWidget):
             return []
         if not self.selected_view_only:
             return list(range(len(self.catalog.photos)))
-        return [i for i, ph in enumerate(self.catalog.photos) if ph.selected]
+        return self.catalog.selected_indices()
 
     def _current_position(self, indices: Optional[List[int]] = None) -> int:
         indices = indices if indices is not None else self._active_indices()
@@ -2407,7 +3134,7 @@ class CullingWidget(QWidget):
         if not self.selected_view_only:
             return
 
-        indices = [i for i, ph in enumerate(self.catalog.photos) if ph.selected]
+        indices = self.catalog.selected_indices()
         if not indices:
             self.selected_view_only = False
             self._update_filter_badge()
@@ -2425,8 +3152,22 @@ class CullingWidget(QWidget):
             next_idx = indices[-1]
         self.idx = next_idx
 
+    # Event types the filter actually acts on; everything else (paints,
+    # moves, hovers...) short-circuits straight to the default handler.
+    _FILTERED_EVENT_TYPES = frozenset((
+        QEvent.Type.KeyPress, QEvent.Type.Wheel, QEvent.Type.MouseButtonPress,
+        QEvent.Type.Shortcut, QEvent.Type.ShortcutOverride,
+    ))
+    _INPUT_EVENT_TYPES = frozenset((
+        QEvent.Type.KeyPress, QEvent.Type.Wheel, QEvent.Type.MouseButtonPress,
+    ))
+
     def eventFilter(self, obj, ev: QEvent):
-        if ev.type() in (QEvent.Type.KeyPress, QEvent.Type.Wheel, QEvent.Type.MouseButtonPress):
+        ev_type = ev.type()
+        if ev_type not in self._FILTERED_EVENT_TYPES:
+            return super().eventFilter(obj, ev)
+
+        if ev_type in self._INPUT_EVENT_TYPES:
             self._note_user_input()
 
         capture_widget = None
@@ -2435,21 +3176,21 @@ class CullingWidget(QWidget):
             capture_widget = key_sequence_cls.active_capture_widget()
         capture_active = capture_widget is not None
 
-        if capture_active and ev.type() in (QEvent.Type.Shortcut, QEvent.Type.ShortcutOverride):
+        if capture_active and ev_type in (QEvent.Type.Shortcut, QEvent.Type.ShortcutOverride):
             try:
                 ev.accept()
             except Exception:
                 pass
             return True
 
-        if ev.type() == QEvent.Type.KeyPress:
+        if ev_type == QEvent.Type.KeyPress:
             if capture_active:
                 return False
             is_capture_active = getattr(obj, "is_hotkey_capture_active", None)
             if callable(is_capture_active) and is_capture_active():
                 return False
 
-        if ev.type() == QEvent.Type.KeyPress and not ev.isAutoRepeat():
+        if ev_type == QEvent.Type.KeyPress and not ev.isAutoRepeat():
             key_sequence = QKeySequence(ev.keyCombination())
             portable = key_sequence.toString(QKeySequence.PortableText)
             actions = self._hotkey_bindings.get(portable, []) if portable else []
@@ -2481,12 +3222,8 @@ class CullingWidget(QWidget):
             return False
         return len(args) >= 4 and isinstance(args[2], Photo)
 
-    def _restore_cancelled_save_task(self, args) -> bool:
-        try:
-            photo_obj = args[2]
-            version = args[3]
-        except Exception:
-            return False
+    @staticmethod
+    def _restore_cancelled_photo(photo_obj, version) -> bool:
         if not isinstance(photo_obj, Photo):
             return False
         restored = False
@@ -2498,6 +3235,23 @@ class CullingWidget(QWidget):
                 restored = True
         return restored
 
+    def _restore_cancelled_save_task(self, args) -> bool:
+        # Batched save tasks carry a list of (path, payload, photo, version).
+        if args and isinstance(args[0], list):
+            restored = False
+            for item in args[0]:
+                try:
+                    restored |= self._restore_cancelled_photo(item[2], item[3])
+                except Exception:
+                    continue
+            return restored
+        try:
+            photo_obj = args[2]
+            version = args[3]
+        except Exception:
+            return False
+        return self._restore_cancelled_photo(photo_obj, version)
+
     def _flush_queue(self, preserve_metadata: bool = True, preserve_keys: Optional[Set[Tuple]] = None):
         flushed = 0
         preserved: List[Tuple] = []
@@ -2505,44 +3259,44 @@ class CullingWidget(QWidget):
         preserved_metadata = 0
         restores = 0
         preserve_set = set(preserve_keys) if preserve_keys is not None else None
-        with self._pending_lock:
-            pending_before = len(self._pending_tasks)
-        try:
-            while True:
-                item = self._taskq.get_nowait()
-                _, _, fn, args = item
-                is_save_task = self._is_metadata_save_task(fn, args)
-                task_key = getattr(fn, "_srp_task_key", None)
-                keep_for_plan = preserve_set is not None and task_key in preserve_set
-                if keep_for_plan or (preserve_metadata and is_save_task):
-                    preserved.append(item)
-                    if keep_for_plan:
-                        preserved_plan += 1
-                    if preserve_metadata and is_save_task:
-                        preserved_metadata += 1
-                else:
-                    if is_save_task and self._restore_cancelled_save_task(args):
-                        restores += 1
-                    if task_key is not None:
-                        with self._pending_lock:
-                            self._pending_tasks.discard(task_key)
-                    flushed += 1
-                try:
-                    self._taskq.task_done()
-                except Exception:
-                    pass
-        except Empty:
-            pass
+        pending_before = len(self._pending_tasks)
+        # Swap each shard's backing heap out under one mutex acquisition
+        # instead of get_nowait/task_done per item (2N lock round-trips for
+        # N tasks), then filter outside the locks.
+        drained: List[Tuple] = []
+        for q in self._taskqs:
+            with q.mutex:
+                shard_items = list(q.queue)
+                q.queue.clear()
+                q.unfinished_tasks = max(0, q.unfinished_tasks - len(shard_items))
+                if q.unfinished_tasks == 0:
+                    q.all_tasks_done.notify_all()
+                q.not_full.notify_all()
+            drained.extend(shard_items)
+        for item in drained:
+            _, _, fn, args = item
+            is_save_task = self._is_metadata_save_task(fn, args)
+            task_key = getattr(fn, "_srp_task_key", None)
+            keep_for_plan = preserve_set is not None and task_key in preserve_set
+            if keep_for_plan or (preserve_metadata and is_save_task):
+                preserved.append(item)
+                if keep_for_plan:
+                    preserved_plan += 1
+                if preserve_metadata and is_save_task:
+                    preserved_metadata += 1
+            else:
+                if is_save_task and self._restore_cancelled_save_task(args):
+                    restores += 1
+                if task_key is not None:
+                    self._pending_tasks.pop(task_key, None)
+                flushed += 1
         for item in preserved:
-            self._taskq.put(item)
+            self._taskqs[next(self._dispatch_counter) % self._num_workers].put(item)
         if preserve_set is None:
             cleared_pending = pending_before
-            with self._pending_lock:
-                self._pending_tasks.clear()
+            self._pending_tasks.clear()
         else:
-            with self._pending_lock:
-                pending_after = len(self._pending_tasks)
-            cleared_pending = max(0, pending_before - pending_after)
+            cleared_pending = max(0, pending_before - len(self._pending_tasks))
         _plog(
             f"flush queue: removed={flushed}, preserved_plan={preserved_plan}, "
             f"preserved_metadata={preserved_metadata}, restored={restores}, "
@@ -2550,7 +3304,7 @@ class CullingWidget(QWidget):
         )
         
     def _recalculate_selected_count(self):
-        self._selected_count = sum(1 for x in self.catalog.photos if x.selected)
+        self._selected_count = int(self.catalog.selected.sum())
 
     def _apply_selection_change(self, previous: bool, current: bool):
         prev = bool(previous)
@@ -2564,112 +3318,210 @@ class CullingWidget(QWidget):
         self.badge_selected.setText(f"Selected: {self._selected_count}")
         self.badge_selected.repaint()
 
-    def _loader_loop(self):
+    def _loader_loop(self, shard: int):
+        own = self._taskqs[shard]
+        others = [q for j, q in enumerate(self._taskqs) if j != shard]
         while not self._loader_stop:
+            q = own
             try:
-                prio, _, fn, args = self._taskq.get(timeout=0.2)
+                item = own.get(timeout=0.05)
             except Empty:
-                continue
+                item = None
+                for cand in others:
+                    try:
+                        item = cand.get_nowait(); q = cand; break
+                    except Empty:
+                        continue
+                if item is None:
+                    continue
+            _, _, fn, args = item
             try:
                 fn(*args)
             except Exception as e:
                 print("Loader error:", e)
             finally:
-                try: self._taskq.task_done()
+                try: q.task_done()
                 except Exception: pass
 
     def _post_task(self, priority: int, fn, *args):
         self._task_counter += 1
-        self._taskq.put((priority, self._task_counter, fn, args))
+        shard = next(self._dispatch_counter) % self._num_workers
+        self._taskqs[shard].put((priority, self._task_counter, fn, args))
         if _prof_enabled():
-            try: qsz = self._taskq.qsize()
+            try: qsz = sum(q.qsize() for q in self._taskqs)
             except Exception: qsz = -1
-            _plog(f"enqueue prio={priority} qsize={qsz}")
+            _plog(f"enqueue prio={priority} shard={shard} qsize={qsz}")
 
-    def _touch(self, od: OrderedDict, key, limit: int):
-        if key in od: od.move_to_end(key)
+    def _touch(self, od: Dict, key, limit: int):
+        val = od.pop(key, None)
+        if val is not None: od[key] = val
         while len(od) > limit:
-            od.popitem(last=False)
+            del od[next(iter(od))]
+
+    def _evict_oldest_locked(self, kind: str, count: Optional[int] = None,
+                             need_bytes: int = 0) -> int:
+        """Drop the oldest entries — `count` of them, or enough to cover
+        `need_bytes` — in one pass. Returns the bytes freed."""
+        cache = self.pil_full_cache if kind == 'full' else self.pil_half_cache
+        sizes = self._cache_item_sizes
+        hits = self._cache_hits
+
+        def _entry_bytes(key: str) -> int:
+            sz = sizes.get((kind, key))
+            if sz is None:
+                pil = cache[key]
+                sz = getattr(pil, '_cached_bytes', None)
+                if sz is None:
+                    sz = _estimate_pil_bytes(pil)
+            return sz
+
+        # Pick victims from an oldest-first window, least-hit entries first.
+        # Pure insertion order evicts a frequently re-shown photo the moment
+        # it ages out; the hit counts let it outlive cold neighbours. The
+        # window keeps this age-biased — freshly inserted (zero-hit) entries
+        # at the tail are not candidates, and the stable sort keeps ties in
+        # insertion order.
+        if count is not None:
+            window = list(itertools.islice(cache, min(len(cache), count * 2)))
+        else:
+            window = list(itertools.islice(cache, max(1, len(cache) // 2)))
+        window.sort(key=lambda k: hits.get((kind, k), 0))
+        doomed: List[str] = []
+        freed = 0
+        if count is not None:
+            for key in window[:count]:
+                freed += _entry_bytes(key)
+                doomed.append(key)
+        else:
+            window_set = set(window)
+            rest = (k for k in cache if k not in window_set)
+            for key in itertools.chain(window, rest):
+                if freed >= need_bytes:
+                    break
+                freed += _entry_bytes(key)
+                doomed.append(key)
+        for key in doomed:
+            cache.pop(key, None)
+            sizes.pop((kind, key), None)
+            self._cache_hits.pop((kind, key), None)
+        return freed
 
     def _enforce_cache_limits_locked(self, kind: str, limit: int):
         cache = self.pil_full_cache if kind == 'full' else self.pil_half_cache
-        while len(cache) > limit:
-            key, pil = cache.popitem(last=False)
-            removed_size = self._cache_item_sizes.pop((kind, key), None)
-            if removed_size is None:
-                removed_size = _estimate_pil_bytes(pil)
-            self._cache_estimated_bytes = max(0, self._cache_estimated_bytes - removed_size)
+        excess = len(cache) - limit
+        if excess > 0:
+            freed = self._evict_oldest_locked(kind, count=excess)
+            self._cache_estimated_bytes = max(0, self._cache_estimated_bytes - freed)
         self._enforce_memory_budget_locked()
 
     def _enforce_memory_budget_locked(self):
-        if psutil is None:
-            return
-        try:
-            vm = psutil.virtual_memory()
-        except Exception:
-            return
-        if not vm:
-            return
-        total = getattr(vm, 'total', None) or 0
-        available = getattr(vm, 'available', None) or 0
-        if total <= 0 or available <= 0:
+        target = self._cache_byte_budget
+        if psutil is not None:
+            # virtual_memory() reads and parses /proc/meminfo; pressure moves
+            # slowly, so reuse the sample for 250 ms unless the caches have
+            # doubled since it was taken.
+            now = time.monotonic()
+            if (self._vm_cache is None
+                    or now - self._vm_cache_ts > 0.25
+                    or self._cache_estimated_bytes > 2 * max(1, self._vm_sample_bytes)):
+                try:
+                    self._vm_cache = psutil.virtual_memory()
+                except Exception:
+                    self._vm_cache = None
+                self._vm_cache_ts = now
+                self._vm_sample_bytes = self._cache_estimated_bytes
+            vm = self._vm_cache
+            if vm:
+                total = getattr(vm, 'total', None) or 0
+                available = getattr(vm, 'available', None) or 0
+                if total > 0 and available > 0:
+                    target = min(target, max(
+                        64 * 1024 * 1024,
+                        int(min(total * 0.15, available * 0.5)),
+                    ))
+
+        over = self._cache_estimated_bytes - target
+        if over <= 0:
             return
 
-        target = max(64 * 1024 * 1024, int(min(total * 0.15, available * 0.5)))
-
-        while self._cache_estimated_bytes > target and self.pil_full_cache:
-            key, pil = self.pil_full_cache.popitem(last=False)
-            removed_size = self._cache_item_sizes.pop(('full', key), None)
-            if removed_size is None:
-                removed_size = _estimate_pil_bytes(pil)
-            self._cache_estimated_bytes = max(0, self._cache_estimated_bytes - removed_size)
-            self.cache_full_limit = max(8, min(self.cache_full_limit, len(self.pil_full_cache)))
+        freed = self._evict_oldest_locked('full', need_bytes=over)
+        if freed < over:
+            freed += self._evict_oldest_locked('half', need_bytes=over - freed)
 
-        while self._cache_estimated_bytes > target and self.pil_half_cache:
-            key, pil = self.pil_half_cache.popitem(last=False)
-            removed_size = self._cache_item_sizes.pop(('half', key), None)
-            if removed_size is None:
-                removed_size = _estimate_pil_bytes(pil)
-            self._cache_estimated_bytes = max(0, self._cache_estimated_bytes - removed_size)
-            self.cache_half_limit = max(16, min(self.cache_half_limit, len(self.pil_half_cache)))
+        self._cache_estimated_bytes = max(0, self._cache_estimated_bytes - freed)
+        self.cache_full_limit = max(8, min(self.cache_full_limit, len(self.pil_full_cache)))
+        self.cache_half_limit = max(16, min(self.cache_half_limit, len(self.pil_half_cache)))
 
-        self._cache_estimated_bytes = max(0, self._cache_estimated_bytes)
+    def _get_pil_cached(self, cache: Dict[str, Image.Image], kind: str,
+                        path: str) -> Optional[Image.Image]:
+        if _GIL_ENABLED:
+            # dict.get is atomic under the GIL and a stale miss only means the
+            # caller re-enqueues a load, so the read itself needs no lock.
+            pil = cache.get(path)
+            if pil is None:
+                return None
+            # Refresh recency opportunistically; skip it when contended
+            # rather than stalling the render path.
+            if self.cache_lock.acquire(blocking=False):
+                try:
+                    if cache.pop(path, None) is not None:
+                        cache[path] = pil
+                        self._cache_hits[(kind, path)] = self._cache_hits.get((kind, path), 0) + 1
+                finally:
+                    self.cache_lock.release()
+            return pil
+        with self.cache_lock:
+            pil = cache.pop(path, None)
+            if pil is not None:
+                cache[path] = pil
+                self._cache_hits[(kind, path)] = self._cache_hits.get((kind, path), 0) + 1
+            return pil
 
     def _get_pil_full_cached(self, path: str) -> Optional[Image.Image]:
-        with self.cache_lock: return self.pil_full_cache.get(path)
+        return self._get_pil_cached(self.pil_full_cache, 'full', path)
     def _get_pil_half_cached(self, path: str) -> Optional[Image.Image]:
-        with self.cache_lock: return self.pil_half_cache.get(path)
+        return self._get_pil_cached(self.pil_half_cache, 'half', path)
     def _put_pil_full(self, path: str, pil: Image.Image):
         if pil is None:
             return
         size = _estimate_pil_bytes(pil)
+        # Carried on the object so evictions never re-derive the size.
+        try: pil._cached_bytes = size
+        except Exception: pass
         with self.cache_lock:
             prev = self.pil_full_cache.pop(path, None)
             if prev is not None:
-                prev_size = self._cache_item_sizes.pop(('full', path), None)
-                if prev_size is not None:
-                    self._cache_estimated_bytes = max(0, self._cache_estimated_bytes - prev_size)
-                else:
-                    self._cache_estimated_bytes = max(0, self._cache_estimated_bytes - _estimate_pil_bytes(prev))
+                prev_size = self._cache_item_sizes.get(('full', path))
+                if prev_size is None:
+                    prev_size = getattr(prev, '_cached_bytes', None)
+                if prev_size is None:
+                    prev_size = _estimate_pil_bytes(prev)
+                # One signed adjustment instead of subtract-then-add.
+                self._cache_estimated_bytes = max(0, self._cache_estimated_bytes + size - prev_size)
+            else:
+                self._cache_estimated_bytes += size
             self.pil_full_cache[path] = pil
             self._cache_item_sizes[('full', path)] = size
-            self._cache_estimated_bytes += size
             self._enforce_cache_limits_locked('full', self.cache_full_limit)
     def _put_pil_half(self, path: str, pil: Image.Image):
         if pil is None:
             return
         size = _estimate_pil_bytes(pil)
+        try: pil._cached_bytes = size
+        except Exception: pass
         with self.cache_lock:
             prev = self.pil_half_cache.pop(path, None)
             if prev is not None:
-                prev_size = self._cache_item_sizes.pop(('half', path), None)
-                if prev_size is not None:
-                    self._cache_estimated_bytes = max(0, self._cache_estimated_bytes - prev_size)
-                else:
-                    self._cache_estimated_bytes = max(0, self._cache_estimated_bytes - _estimate_pil_bytes(prev))
+                prev_size = self._cache_item_sizes.get(('half', path))
+                if prev_size is None:
+                    prev_size = getattr(prev, '_cached_bytes', None)
+                if prev_size is None:
+                    prev_size = _estimate_pil_bytes(prev)
+                self._cache_estimated_bytes = max(0, self._cache_estimated_bytes + size - prev_size)
+            else:
+                self._cache_estimated_bytes += size
             self.pil_half_cache[path] = pil
             self._cache_item_sizes[('half', path)] = size
-            self._cache_estimated_bytes += size
             self._enforce_cache_limits_locked('half', self.cache_half_limit)
     def _put_resized_pixmap(self, path: str, size: QSize, pixmap: QPixmap):
         key = (path, size.width(), size.height())
@@ -2677,18 +3529,34 @@ class CullingWidget(QWidget):
             self.resized_pixmap_cache[key] = pixmap; self._touch(self.resized_pixmap_cache, key, self.cache_resized_limit)
 
     def _enqueue(self, priority: int, key: Tuple, fn, *args):
-        with self._pending_lock:
-            if key in self._pending_tasks: return
-            self._pending_tasks.add(key)
+        token = object()
+        if self._pending_tasks.setdefault(key, token) is not token:
+            return
         def _wrap(*a):
             try: fn(*a)
             finally:
-                with self._pending_lock:
-                    self._pending_tasks.discard(key)
+                self._pending_tasks.pop(key, None)
         setattr(_wrap, "_srp_task_key", key)
         setattr(_wrap, "_srp_task_origin", fn)
         self._post_task(priority, _wrap, *args)
 
+    def _enqueue_bulk(self, jobs: List[Tuple[int, Tuple, Callable[..., None], Tuple]]):
+        """Register and post a batch of tasks, deduping against pending keys."""
+        token = object()
+        accepted = []
+        for priority, key, fn, args in jobs:
+            if self._pending_tasks.setdefault(key, token) is not token:
+                continue
+            accepted.append((priority, key, fn, args))
+        for priority, key, fn, args in accepted:
+            def _wrap(*a, _fn=fn, _key=key):
+                try: _fn(*a)
+                finally:
+                    self._pending_tasks.pop(_key, None)
+            setattr(_wrap, "_srp_task_key", key)
+            setattr(_wrap, "_srp_task_origin", fn)
+            self._post_task(priority, _wrap, *args)
+
     def _enqueue_load(self, path: str, kind: str, priority: int):
         key = (path, kind); self._enqueue(priority, key, self._worker_entry, path, kind)
     def _enqueue_meta(self, path: str):
@@ -2699,7 +3567,18 @@ class CullingWidget(QWidget):
         key = (path, 'thumb', target_h); self._enqueue(priority, key, self._worker_build_thumb, path, target_h)
     def _enqueue_extract_thumb(self, path: str, target_h: int, priority: int):
         key = (path, 'extract_thumb', target_h); self._enqueue(priority, key, self._worker_extract_thumb, path, target_h)
+    def _has_resized_pixmap(self, path: str, w: int, h: int) -> bool:
+        key = (path, w, h)
+        if _GIL_ENABLED:
+            return key in self.resized_pixmap_cache
+        with self.cache_lock:
+            return key in self.resized_pixmap_cache
+
     def _enqueue_build_resized_pixmap(self, path: str, size: QSize, priority: int):
+        # Re-scheduling fires for neighbors that may already be rendered;
+        # don't pay for a second LANCZOS pass on a cache hit.
+        if self._has_resized_pixmap(path, size.width(), size.height()):
+            return
         key = (path, 'resized_pixmap', size.width(), size.height())
         self._enqueue(priority, key, self._worker_build_resized_pixmap, path, size)
 
@@ -2737,15 +3616,20 @@ class CullingWidget(QWidget):
                 self.signals.xmp.emit(path, xmp_data)
 
     def _acquire_full_slot(self):
-        while not self._loader_stop:
-            with self._full_lock:
+        # Condition wait instead of a 30ms sleep-poll: release wakes us
+        # immediately. The timeout re-checks _loader_stop and _is_user_hot
+        # (the limit can loosen without anyone releasing a slot).
+        with self._full_cv:
+            while not self._loader_stop:
                 limit = 1 if self._is_user_hot(300.0) else max(1, min(3, self._num_workers // 2))
                 if self._full_running < limit:
                     self._full_running += 1; return
-            time.sleep(0.03)
+                self._full_cv.wait(timeout=0.3)
 
     def _release_full_slot(self):
-        with self._full_lock: self._full_running = max(0, self._full_running - 1)
+        with self._full_cv:
+            self._full_running = max(0, self._full_running - 1)
+            self._full_cv.notify()
 
     def _worker_build_resized_pixmap(self, path: str, bounding_box_size: QSize):
         pil = self._get_pil_half_cached(path) or self._get_pil_full_cached(path)
@@ -2769,11 +3653,25 @@ class CullingWidget(QWidget):
 
         with _ptime(f"worker pixmap resize {os.path.basename(path)} -> {target_w}x{target_h}", warn_ms=20):
             try:
-                resize_filter = getattr(Image, 'LANCZOS', Image.BILINEAR)
-                pil_resized = pil.resize((target_w, target_h), resize_filter)
-
-                qimg = ImageQt.ImageQt(pil_resized.convert("RGBA"))
-                qimg = qimg.convertToFormat(QImage.Format_ARGB32_Premultiplied)
+                # Knock the image down to within 2x of target with an integer
+                # box reduce first (cheap, SIMD in Pillow), so the LANCZOS
+                # kernel only runs over a fraction of the source pixels.
+                factor = max(1, min(img_w // (2 * target_w), img_h // (2 * target_h)))
+                if factor > 1:
+                    pil = pil.reduce(factor)
+                pil_resized = pil.resize((target_w, target_h), RESIZE_FILTER_HQ)
+
+                # Always hand the GUI thread ARGB32_Premultiplied BGRA: the
+                # pixmap backend's native format, so QPixmap.fromImage with
+                # NoFormatConversion is a reference bump instead of a per-show
+                # O(W*H) convert. Pillow emits the BGRA word order ARGB32
+                # expects on little-endian; sources here are opaque, so
+                # straight alpha equals premultiplied. .copy() owns the buffer.
+                if pil_resized.mode != 'RGBA':
+                    pil_resized = pil_resized.convert('RGBA')
+                data = pil_resized.tobytes('raw', 'BGRA')
+                qimg = QImage(data, target_w, target_h, target_w * 4,
+                              QImage.Format_ARGB32_Premultiplied).copy()
             except Exception as e:
                 print(f"Error resizing image for {path}: {e}")
                 return
@@ -2788,7 +3686,7 @@ class CullingWidget(QWidget):
         if ph <= 0: return
         ratio = target_h / float(ph); tw, th = max(1, int(pw * ratio)), target_h
         with _ptime(f"worker thumb resize {os.path.basename(path)} -> {target_h}px", warn_ms=10):
-            try: thumb = pil.resize((tw, th), Image.BILINEAR)
+            try: thumb = pil.resize((tw, th), RESIZE_FILTER_FAST)
             except Exception: thumb = pil
         self.signals.thumb_ready.emit(path, target_h, thumb)
 
@@ -2805,11 +3703,18 @@ class CullingWidget(QWidget):
             else: print(f"Error extracting thumb for {os.path.basename(path)}: {e}")
 
     def _read_metadata_heavy(self, path: str) -> Dict[str, str]:
+        cache = _meta_disk_cache()
+        if cache is not None:
+            cached = cache.get(path)
+            if cached is not None:
+                return cached
         ext = os.path.splitext(path)[1].lower(); meta: Dict[str, str] = {}
         try:
             if ext in {'.jpg', '.jpeg'}: meta.update(_jpeg_exif_as_meta(path))
             else: meta.update(_raw_meta_as_meta(path))
         except Exception: pass
+        if cache is not None and meta:
+            cache.put(path, meta)
         return meta
 
     def _set_meta_label(self, m: Dict[str,str]):
@@ -2820,6 +3725,12 @@ class CullingWidget(QWidget):
         main_line = '  |  '.join(parts)
         cam_parts = [x for x in [m.get('make'), m.get('model')] if x]; cam_line = ' '.join(cam_parts)
         lens_line = m.get('lens', ''); dt_line = m.get('dt', '')
+        # Neighbor meta arrivals re-call this with identical content; skip the
+        # rich-text relayout that setText triggers when nothing changed.
+        digest = hash((main_line, cam_line, lens_line, dt_line))
+        if digest == self._last_meta_digest:
+            return
+        self._last_meta_digest = digest
         html = f"""
             <div style=\"margin:0; padding:0;\">
               <div style=\"margin:0; padding:0; font-weight:600; color:{theme_color('text.primary')};\">{_h(main_line)}
@@ -2837,8 +3748,14 @@ class CullingWidget(QWidget):
         if pil_full is not None: m_dyn['size'] = f"{pil_full.size[0]}x{pil_full.size[1]}"
         elif pil_half is not None: m_dyn['size'] = f"(Half) {pil_half.size[0]}x{pil_half.size[1]}"
         try:
-            st = os.stat(path)
-            m_dyn.setdefault('dt', datetime.fromtimestamp(getattr(st, 'st_mtime', st.st_mtime)).strftime('%Y-%m-%d %H:%M:%S'))
+            # The stat + strftime pair re-runs on every meta-ready redraw of
+            # the same photo; cache the formatted string per path.
+            cached = self._mtime_str_cache.get(path)
+            if cached is None:
+                st = os.stat(path)
+                cached = datetime.fromtimestamp(st.st_mtime).strftime('%Y-%m-%d %H:%M:%S')
+                self._mtime_str_cache[path] = cached
+            m_dyn.setdefault('dt', cached)
         except Exception: pass
         m_heavy = self._meta_cache.get(path)
         if not m_heavy: self._enqueue_meta(path); m_heavy = {}
@@ -2904,7 +3821,7 @@ class CullingWidget(QWidget):
         self._update_selected_badge_fast()
         self._update_view_after_selection_change(current_index)
         self._show_current()
-        self.autosave_timer.start(1500)
+        self._schedule_autosave()
 
     def unselect_current(self):
         p = self._current()
@@ -2919,7 +3836,7 @@ class CullingWidget(QWidget):
             self._update_selected_badge_fast()
             self._update_view_after_selection_change(current_index)
             self._show_current()
-            self.autosave_timer.start(1500)
+            self._schedule_autosave()
 
     def set_rating(self, rating: int):
         p = self._current()
@@ -2932,7 +3849,7 @@ class CullingWidget(QWidget):
         
         self._show_temporary_status(f"Rating set to {p.rating} star(s)", 1000)
         self._update_filmstrip()
-        self.autosave_timer.start(1500)
+        self._schedule_autosave()
 
     def set_color_label(self, label: Optional[str]):
         p = self._current()
@@ -2945,7 +3862,7 @@ class CullingWidget(QWidget):
         
         self._show_temporary_status(f"Color label set to {p.color_label or 'None'}", 1000)
         self._update_filmstrip()
-        self.autosave_timer.start(1500)
+        self._schedule_autosave()
 
     def toggle_zebra(self):
         self.zebra_toggled = not self.zebra_toggled
@@ -3002,11 +3919,9 @@ class CullingWidget(QWidget):
             action.setEnabled(enabled)
 
     def _on_filmstrip_click(self, path: str):
-        for i, p in enumerate(self.catalog.photos):
-            if p.path == path:
-                if self.idx == i: return
-                self.idx = i; self._show_current(); self._heavy_load_scheduler.start()
-                break
+        i = self._photo_index_by_path.get(path)
+        if i is None or self.idx == i: return
+        self.idx = i; self._show_current(); self._heavy_load_scheduler.start()
 
     def _filmstrip_loader(self, path: str, target_h: int) -> Optional[QPixmap]:
         key = (path, target_h)
@@ -3052,19 +3967,26 @@ class CullingWidget(QWidget):
         self.filmstrip.set_items(items)
 
         target_h = max(32, self.filmstrip.height() - 0)
-        for it in items:
-            self._enqueue_thumb(it['path'], target_h, priority=-96)
-
-        sched = []
-        for d in range(1, 5 + 1):
-            j_f = self.idx + d; j_b = self.idx - d
-            if j_f < len(self.catalog.photos): sched.append((self.catalog.photos[j_f].path, d))
-            if j_b >= 0: sched.append((self.catalog.photos[j_b].path, d))
-        sched.sort(key=lambda x: x[1])
 
+        # The visible items and the ±5 prefetch ring overlap heavily; collect
+        # each path once at its best priority before touching the queue.
         FILMSTRIP_BASE = -96
-        for pth, d in sched:
-            self._enqueue_thumb(pth, target_h, priority=FILMSTRIP_BASE + d)
+        wanted: Dict[str, int] = {it['path']: FILMSTRIP_BASE for it in items}
+        for d in range(1, 5 + 1):
+            for j in (self.idx + d, self.idx - d):
+                if 0 <= j < len(self.catalog.photos):
+                    pth = self.catalog.photos[j].path
+                    pri = FILMSTRIP_BASE + d
+                    if pri < wanted.get(pth, 0):
+                        wanted[pth] = pri
+
+        to_post = [
+            (pth, pri) for pth, pri in sorted(wanted.items(), key=itemgetter(1))
+            if (pth, 'thumb', target_h) not in self._pending_tasks
+            and (pth, target_h) not in self._pm_thumb_cache
+        ]
+        for pth, pri in to_post:
+            self._enqueue_thumb(pth, target_h, priority=pri)
 
     @Slot(str, dict)
     def _on_meta_ready(self, path: str, meta: Dict[str, str]):
@@ -3073,9 +3995,14 @@ class CullingWidget(QWidget):
         if cur and cur.path == path:
             self._update_metadata(path)
     
+    @Slot(list)
+    def _on_xmp_batch(self, results: list):
+        for path, data in results:
+            self._on_xmp_ready(path, data)
+
     @Slot(str, dict)
     def _on_xmp_ready(self, path: str, data: Dict):
-        photo = next((p for p in self.catalog.photos if p.path == path), None)
+        photo = self._photo_by_path.get(path)
         if not photo:
             return
 
@@ -3099,13 +4026,15 @@ class CullingWidget(QWidget):
                 photo.color_label = label_val
             if selected_changed:
                 photo.selected = selected_val
+            if rating_changed or selected_changed:
+                photo.sync_catalog_arrays()
 
             if not (rating_changed or label_changed or selected_changed):
                 return
 
             current_selected = photo.selected
 
-        photo_index = self.catalog.photos.index(photo)
+        photo_index = self._photo_index_by_path.get(path, photo.catalog_index)
         if selected_changed:
             self._apply_selection_change(previous_selected, current_selected)
         self._update_view_after_selection_change(photo_index)
@@ -3118,7 +4047,7 @@ class CullingWidget(QWidget):
         self._update_selected_badge_fast()
 
         if selected_changed:
-            self.autosave_timer.start(1500)
+            self._schedule_autosave()
         
     def _refresh_statusbar(self):
         if self.status_restore_timer.isActive(): return
@@ -3134,8 +4063,17 @@ class CullingWidget(QWidget):
         msg = f"[{current_num}/{total} {view_scope}]  Selected: {total_sel}  {os.path.basename(p.path)}  |  workers: {self._num_workers}"
         self.status_message.emit(msg, 0)
 
+    def _current_target_size(self) -> QSize:
+        ts = self.view._target_size_cache
+        if ts is None:
+            area = self.view.contentsRect(); dpr = self.view.devicePixelRatioF()
+            ts = QSize(int(area.width() * dpr), int(area.height() * dpr))
+            self.view._target_size_cache = ts
+        return ts
+
     def _show_current(self):
         self._update_view_after_selection_change(self.idx)
+        self._last_meta_digest = None
         indices = self._active_indices()
         if not indices:
             self.meta_left.setText("")
@@ -3170,13 +4108,16 @@ class CullingWidget(QWidget):
         self._refresh_statusbar()
         self._update_filmstrip(k_forward=5, k_backward=5)
 
-        area = self.view.contentsRect(); dpr = self.view.devicePixelRatioF()
-        target_size = QSize(int(area.width() * dpr), int(area.height() * dpr))
+        target_size = self._current_target_size()
         cache_key = (p.path, target_size.width(), target_size.height())
 
-        with self.cache_lock:
+        if _GIL_ENABLED:
             pixmap = self.resized_pixmap_cache.get(cache_key)
             pil_half = self.pil_half_cache.get(p.path)
+        else:
+            with self.cache_lock:
+                pixmap = self.resized_pixmap_cache.get(cache_key)
+                pil_half = self.pil_half_cache.get(p.path)
 
         if pixmap:
             self.view.set_pils(self._get_pil_full_cached(p.path), pil_half)
@@ -3203,8 +4144,7 @@ class CullingWidget(QWidget):
         if is_current:
             self.view.set_pils(self._get_pil_full_cached(path), self._get_pil_half_cached(path))
             if kind == 'half':
-                area = self.view.contentsRect(); dpr = self.view.devicePixelRatioF()
-                target_size = QSize(int(area.width() * dpr), int(area.height() * dpr))
+                target_size = self._current_target_size()
                 target_h = max(32, (self.filmstrip.height() or self.filmstrip.sizeHint().height() or 104))
                 self._enqueue_thumb(path, target_h, priority=-79)
                 self._enqueue_build_resized_pixmap(path, target_size, -99)
@@ -3223,18 +4163,26 @@ class CullingWidget(QWidget):
         self._load_failures.add(path)
         self._show_toast(f"Failed to load image: {os.path.basename(path)}", 2000)
 
-    @Slot(str)
-    def _on_xmp_saved(self, path: str):
+    @Slot(list)
+    def _on_xmp_saved(self, paths: list):
         self._refresh_statusbar()
         cur = self._current()
-        if cur and cur.path == path:
-            self._update_metadata(path)
-        self.status_message.emit(f"Metadata saved for {os.path.basename(path)}", 2000)
+        if cur and cur.path in paths:
+            self._update_metadata(cur.path)
+        if len(paths) == 1:
+            msg = f"Metadata saved for {os.path.basename(paths[0])}"
+        else:
+            msg = f"Metadata saved for {len(paths)} photos"
+        self.status_message.emit(msg, 2000)
 
-    @Slot(str)
-    def _on_xmp_save_failed(self, path: str):
-        self.status_message.emit(f"Failed to save metadata for {os.path.basename(path)}", 3000)
-        self._show_toast(f"Failed to save metadata: {os.path.basename(path)}", 2000)
+    @Slot(list)
+    def _on_xmp_save_failed(self, paths: list):
+        if len(paths) == 1:
+            msg = f"Failed to save metadata: {os.path.basename(paths[0])}"
+        else:
+            msg = f"Failed to save metadata for {len(paths)} photos"
+        self.status_message.emit(msg, 3000)
+        self._show_toast(msg, 2000)
 
     @Slot(str, QSize, object)
     def _on_resized_pixmap_ready(self, path: str, size: QSize, qimg_obj):
@@ -3262,18 +4210,20 @@ class CullingWidget(QWidget):
     def _on_thumb_ready(self, path: str, target_h: int, pil_small_obj):
         if pil_small_obj is None: return
         key = (path, target_h)
-        pm_new = QPixmap.fromImage(ImageQt.ImageQt(pil_small_obj.convert('RGB')))
+        pil = pil_small_obj if pil_small_obj.mode == 'RGB' else pil_small_obj.convert('RGB')
+        w, h = pil.size
+        pm_new = QPixmap.fromImage(
+            # fromImage copies, so the wrapper QImage can borrow the bytes.
+            QImage(pil.tobytes(), w, h, w * 3, QImage.Format_RGB888)
+        )
         
-        if key in self._pm_thumb_cache:
-            self._pm_thumb_cache.pop(key, None)
+        self._pm_thumb_cache.pop(key, None)
         self._pm_thumb_cache[key] = pm_new
-        
-        while len(self._pm_thumb_cache) > self._pm_thumb_limit:
-            try:
-                oldest_key = next(iter(self._pm_thumb_cache))
-            except StopIteration:
-                break
-            self._pm_thumb_cache.pop(oldest_key, None)
+
+        excess = len(self._pm_thumb_cache) - self._pm_thumb_limit
+        if excess > 0:
+            for k in list(itertools.islice(self._pm_thumb_cache, excess)):
+                self._pm_thumb_cache.pop(k, None)
 
         self.filmstrip.update()
 
@@ -3293,8 +4243,9 @@ class CullingWidget(QWidget):
         preserve_keys = set(dedup.keys())
         self._flush_queue(preserve_keys=preserve_keys)
         ordered = sorted(dedup.items(), key=lambda item: item[1][0])
-        for key, (priority, fn, args) in ordered:
-            self._enqueue(priority, key, fn, *args)
+        self._enqueue_bulk(
+            [(priority, key, fn, args) for key, (priority, fn, args) in ordered]
+        )
 
     def _schedule_loading_plan_fire(self):
         cur = self._current()
@@ -3303,8 +4254,7 @@ class CullingWidget(QWidget):
             return
         cur_path = cur.path; total = len(self.catalog.photos)
 
-        area = self.view.contentsRect(); dpr = self.view.devicePixelRatioF()
-        target_size = QSize(int(area.width() * dpr), int(area.height() * dpr))
+        target_size = self._current_target_size()
 
         plan: List[Tuple[int, Tuple, Callable[..., None], Tuple]] = []
 
@@ -3315,6 +4265,8 @@ class CullingWidget(QWidget):
             plan.append((priority, (path, 'xmp'), self._worker_entry, (path, 'xmp')))
 
         def plan_resized(path: str, size: QSize, priority: int):
+            if self._has_resized_pixmap(path, size.width(), size.height()):
+                return
             plan.append(
                 (
                     priority,
@@ -3379,9 +4331,28 @@ class CullingWidget(QWidget):
             self._enqueue_load(cur.path, 'full', -90)
 
     def _load_all_xmp_data(self):
-        """Enqueue loading of XMP data for all photos at startup."""
-        for i, photo in enumerate(self.catalog.photos):
-            self._enqueue_xmp(photo.path, priority=100 + i)
+        """Enqueue loading of XMP data for all photos at startup.
+
+        Batched 64 sidecars per task: one queued signal per group instead of
+        one per photo, so a 5000-file folder does not swamp the event loop.
+        """
+        photos = self.catalog.photos
+        for i in range(0, len(photos), 64):
+            group = [p.path for p in photos[i:i + 64]]
+            key = ('xmp_batch', group[0])
+            self._enqueue(100 + i, key, self._worker_xmp_batch, group)
+
+    def _worker_xmp_batch(self, paths: List[str]):
+        results = []
+        for path in paths:
+            try:
+                data = read_xmp_sidecar(path)
+            except Exception:
+                data = None
+            if data:
+                results.append((path, data))
+        if results:
+            self.signals.xmp_batch.emit(results)
 
     def _load_selections(self):
         total = len(self.catalog.photos)
@@ -3395,6 +4366,7 @@ class CullingWidget(QWidget):
                 selected_set = set(data.get('selected_paths', []))
                 for p in self.catalog.photos:
                     p.selected = (p.path in selected_set)
+                    p.sync_catalog_arrays()
             except Exception:
                 pass
             finally:
@@ -3414,29 +4386,43 @@ class CullingWidget(QWidget):
             progress.show()
             QApplication.processEvents()
 
-        selected_paths: List[str] = []
-        for idx, photo in enumerate(self.catalog.photos, start=1):
-            data = read_xmp_sidecar(photo.path)
-            rating_val = data.get('rating') if data else None
-            label_val = data.get('color_label') if data else None
-            selected_val = data.get('selected') if data else None
-
-            with photo.lock:
-                if data:
-                    photo.xmp_loaded = True
-                if rating_val is not None:
-                    photo.rating = rating_val
-                if label_val is not None:
-                    photo.color_label = label_val
-                if selected_val is not None:
-                    photo.selected = selected_val
-
-            if photo.selected:
-                selected_paths.append(photo.path)
+        max_workers = min(32, (os.cpu_count() or 4) * 4)
+        done = 0
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    read_xmp_sidecar, photo.path, self.catalog.sidecar_stat(photo.path)
+                ): photo
+                for photo in self.catalog.photos
+            }
+            for future in as_completed(futures):
+                photo = futures[future]
+                try:
+                    data = future.result()
+                except Exception:
+                    data = {}
+                rating_val = data.get('rating') if data else None
+                label_val = data.get('color_label') if data else None
+                selected_val = data.get('selected') if data else None
+
+                with photo.lock:
+                    if data:
+                        photo.xmp_loaded = True
+                    if rating_val is not None:
+                        photo.rating = rating_val
+                    if label_val is not None:
+                        photo.color_label = label_val
+                    if selected_val is not None:
+                        photo.selected = selected_val
+                    photo.sync_catalog_arrays()
+
+                done += 1
+                if progress:
+                    progress.setValue(done)
+                    if done % 25 == 0 or done == total:
+                        QApplication.processEvents()
 
-            if progress:
-                progress.setValue(idx)
-                QApplication.processEvents()
+        selected_paths = [p.path for p in self.catalog.photos if p.selected]
 
         if progress:
             progress.close()
@@ -3450,8 +4436,8 @@ class CullingWidget(QWidget):
             'selected_paths': selected_paths,
         }
         try:
-            with open(self.selections_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            _write_text_atomic(self.selections_path,
+                               json.dumps(data, ensure_ascii=False, indent=2))
         except Exception as e:
             print(f"Error creating selections.json: {e}")
 
@@ -3468,21 +4454,47 @@ class CullingWidget(QWidget):
             return
 
         self.autosave_timer.stop()
+        self._autosave_first_dirty_ts = None
 
         selected_paths = [p.path for p in self.catalog.photos if p.selected]
         data = {'root': self.catalog.root, 'saved_at': time.strftime('%Y-%m-%d %H:%M:%S'),
                 'selected_paths': selected_paths}
-        try:
-            with open(self.selections_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-        except Exception as e:
-            print(f"Error saving selections.json: {e}")
+        payload = json.dumps(data, ensure_ascii=False, indent=2)
+
+        def _write_selections(text: str):
+            try:
+                _write_text_atomic(self.selections_path, text)
+            except Exception as e:
+                print(f"Error saving selections.json: {e}")
+
+        # Serialize on the GUI thread (the snapshot must be consistent) but
+        # push the disk write to a worker so the autosave tick returns fast;
+        # only the blocking shutdown save writes inline.
+        if wait:
+            _write_selections(payload)
+        else:
+            # Mark as a metadata save so _flush_queue preserves it: dropping
+            # this task silently loses the selection snapshot on navigation
+            # and on shutdown.
+            setattr(_write_selections, "_srp_metadata_save", True)
+            self._post_task(20, _write_selections, payload)
 
         tasks: List[Tuple[Photo, Dict, int]] = []
         for photo in self.catalog.photos:
+            # Cheap lock-free prefilter: most photos are clean, and taking N
+            # mutexes to read two bools dominates this loop on big catalogs.
+            # The flags are re-checked under the lock before anything flips.
+            if not photo.is_dirty or photo.is_saving:
+                continue
             with photo.lock:
                 if not photo.is_dirty or photo.is_saving:
                     continue
+                state = (photo.rating, photo.color_label, photo.selected)
+                if state == photo.persisted_state:
+                    # Edits reverted to what the sidecar already holds; the
+                    # write would be a byte-identical no-op.
+                    photo.is_dirty = False
+                    continue
                 data_to_write = {
                     'rating': photo.rating,
                     'color_label': photo.color_label,
@@ -3500,9 +4512,12 @@ class CullingWidget(QWidget):
         wait_events: List[threading.Event] = []
 
         def _write_task_with_cleanup(path, data, photo_obj, version, done_event: Optional[threading.Event]):
+            # Returns 'saved'/'failed'/None; the batch wrapper coalesces the
+            # outcomes into one signal per batch instead of one per file.
             success = False
             try:
-                success = bool(write_xmp_sidecar(path, data))
+                success = bool(write_xmp_sidecar(path, data, fsync=wait))
+                self._mtime_str_cache.pop(path, None)
             except Exception as e:
                 print(f"Unexpected error saving XMP for {os.path.basename(path)}: {e}")
                 success = False
@@ -3523,22 +4538,46 @@ class CullingWidget(QWidget):
                             signal_to_emit = 'failed'
                         else:
                             photo_obj.saving_version = version
+                            photo_obj.persisted_state = (
+                                data.get('rating'), data.get('color_label'), data.get('selected')
+                            )
                             signal_to_emit = 'saved'
                 finally:
                     if done_event is not None:
                         done_event.set()
-                if signal_to_emit == 'saved':
-                    self.signals.xmp_saved.emit(path)
-                elif signal_to_emit == 'failed':
-                    self.signals.xmp_save_failed.emit(path)
+                return signal_to_emit
 
         setattr(_write_task_with_cleanup, "_srp_metadata_save", True)
 
-        for photo, payload, version in tasks:
+        def _write_batch(items, done_event: Optional[threading.Event]):
+            saved: List[str] = []
+            failed: List[str] = []
+            try:
+                for path, payload, photo_obj, version in items:
+                    outcome = _write_task_with_cleanup(path, payload, photo_obj, version, None)
+                    if outcome == 'saved':
+                        saved.append(path)
+                    elif outcome == 'failed':
+                        failed.append(path)
+            finally:
+                if done_event is not None:
+                    done_event.set()
+            if saved:
+                self.signals.xmp_saved.emit(saved)
+            if failed:
+                self.signals.xmp_save_failed.emit(failed)
+
+        setattr(_write_batch, "_srp_metadata_save", True)
+
+        # One task per 32 sidecars: a dirty set of hundreds would otherwise
+        # flood the taskq with tiny jobs and per-task scheduling overhead.
+        for i in range(0, len(tasks), 32):
+            batch = [(photo.path, payload, photo, version)
+                     for photo, payload, version in tasks[i:i + 32]]
             done_event = threading.Event() if wait else None
             if done_event is not None:
                 wait_events.append(done_event)
-            self._post_task(20, _write_task_with_cleanup, photo.path, payload, photo, version, done_event)
+            self._post_task(20, _write_batch, batch, done_event)
 
         self._show_temporary_status(f"Auto-saved metadata for {len(tasks)} photos.", 2000)
 
@@ -3565,11 +4604,14 @@ class CullingWidget(QWidget):
 
     @Slot()
     def _finish_cleanup_on_gui(self):
-        self.save_all_dirty_files()
+        # wait=True writes inline with fsync: this is the last chance to get
+        # the sidecars and selections.json durably on disk before exit.
+        self.save_all_dirty_files(wait=True)
         self._flush_queue()
 
         try:
-            self._taskq.join()
+            for q in self._taskqs:
+                q.join()
         except Exception:
             pass
 
@@ -4451,7 +5493,27 @@ class WelcomeWidget(QWidget):
             w = it.widget()
             if w: w.deleteLater()
 
-        valid = [f for f in folders if os.path.isdir(f)][:3]
+        # isdir on a stale network mount can block for seconds and freeze the
+        # welcome screen; run the checks on daemon threads with a short
+        # deadline and treat any straggler as invalid. Daemon threads matter:
+        # executor threads get joined in an atexit hook, so a hung check
+        # would move the freeze from the welcome screen to process exit.
+        candidates = [f for f in folders if f]
+        results: Dict[str, bool] = {}
+        if candidates:
+            def _check(folder: str):
+                try:
+                    results[folder] = os.path.isdir(folder)
+                except Exception:
+                    pass
+            checkers = [threading.Thread(target=_check, args=(f,), daemon=True)
+                        for f in candidates]
+            for t in checkers:
+                t.start()
+            deadline = time.monotonic() + 0.25
+            for t in checkers:
+                t.join(timeout=max(0.0, deadline - time.monotonic()))
+        valid = [f for f in candidates if results.get(f)][:3]
         if valid:
             for p in valid:
                 name = os.path.basename(os.path.normpath(p)) or p
@@ -4504,6 +5566,13 @@ class AppWindow(QMainWindow):
         self._export_success_callback: Optional[Callable[[ExportResult], None]] = None
         self._export_error_callback: Optional[Callable[[str], None]] = None
         self._export_cancel_callback: Optional[Callable[[], None]] = None
+        # Latest progress tuple, pushed to the dialog at ~30 Hz; applying
+        # every worker signal floods the GUI thread with metacalls.
+        self._export_progress_pending: Optional[Tuple[int, int, str]] = None
+        self._export_progress_timer = QTimer(self)
+        self._export_progress_timer.setSingleShot(True)
+        self._export_progress_timer.setInterval(33)
+        self._export_progress_timer.timeout.connect(self._apply_export_progress)
         self._cleanup_thread: Optional[QThread] = None
         self._cleanup_worker: Optional[_ExportCleanupWorker] = None
         self._pending_culling_teardown: Optional[CullingWidget] = None
@@ -4512,7 +5581,9 @@ class AppWindow(QMainWindow):
         self.app_data_path = QStandardPaths.writableLocation(QStandardPaths.AppDataLocation)
         os.makedirs(self.app_data_path, exist_ok=True)
         self.app_state_file = os.path.join(self.app_data_path, "app_state.json")
-        self.recent_folders = []
+        # MRU map: keys are folder paths, newest first; OrderedDict keeps
+        # the bump-to-front O(1) instead of list remove/insert.
+        self.recent_folders: "OrderedDict[str, None]" = OrderedDict()
         self._load_app_state()
 
         self.stack = QStackedWidget()
@@ -4523,7 +5594,7 @@ class AppWindow(QMainWindow):
 
         self.welcome_screen = WelcomeWidget(
             on_select_folder=self.select_folder,
-            recent_folders=self.recent_folders
+            recent_folders=list(self.recent_folders)
         )
         self.welcome_screen.folder_selected.connect(self.start_culling_session)
         self.stack.addWidget(self.welcome_screen)
@@ -4609,20 +5680,21 @@ class AppWindow(QMainWindow):
         try:
             with open(self.app_state_file, 'r', encoding='utf-8') as f:
                 state = json.load(f)
-                self.recent_folders = state.get("recent_folders", [])
+                self.recent_folders = OrderedDict(
+                    (p, None) for p in state.get("recent_folders", [])
+                )
                 self.has_seen_tutorial = bool(state.get("has_seen_tutorial", False))
         except (FileNotFoundError, json.JSONDecodeError):
-            self.recent_folders = []
+            self.recent_folders = OrderedDict()
             self.has_seen_tutorial = False
 
     def _save_app_state(self):
         try:
             state = {
-                "recent_folders": self.recent_folders,
+                "recent_folders": list(self.recent_folders),
                 "has_seen_tutorial": self.has_seen_tutorial,
             }
-            with open(self.app_state_file, 'w', encoding='utf-8') as f:
-                json.dump(state, f, indent=2)
+            _write_text_atomic(self.app_state_file, json.dumps(state, indent=2))
         except Exception as e:
             print(f"Error saving app state: {e}")
 
@@ -4709,10 +5781,10 @@ class AppWindow(QMainWindow):
             self.stack.removeWidget(self.culling_widget)
             self.culling_widget.deleteLater()
 
-        if root in self.recent_folders:
-            self.recent_folders.remove(root)
-        self.recent_folders.insert(0, root)
-        self.recent_folders = self.recent_folders[:5]
+        self.recent_folders[root] = None
+        self.recent_folders.move_to_end(root, last=False)
+        while len(self.recent_folders) > 5:
+            self.recent_folders.popitem(last=True)
         self._save_app_state()
 
         self.culling_widget = CullingWidget(
@@ -4865,6 +5937,17 @@ class AppWindow(QMainWindow):
         thread = QThread(self)
         worker.moveToThread(thread)
         thread.started.connect(worker.run)
+        # Canonical teardown: let the finished signal reap both objects so
+        # shutdown never blocks the GUI thread in wait().
+        thread.finished.connect(worker.deleteLater)
+        thread.finished.connect(thread.deleteLater)
+        # The lambda's default args keep the Python refs alive until the
+        # thread has fully stopped; dropping them earlier destroys the
+        # parentless worker on the GUI thread while queued slots (e.g. a
+        # late dialog.canceled -> request_cancel) may still target it.
+        thread.finished.connect(
+            lambda w=worker, t=thread: self._reap_export_objects(w, t)
+        )
 
         dialog = QProgressDialog("Preparing export...", "Cancel", 0, 0, self)
         dialog.setWindowTitle("Exporting Selected Files")
@@ -4899,6 +5982,16 @@ class AppWindow(QMainWindow):
         return True
 
     def _on_export_progress(self, value: int, maximum: int, message: str):
+        self._export_progress_pending = (value, maximum, message)
+        if not self._export_progress_timer.isActive():
+            self._export_progress_timer.start()
+
+    def _apply_export_progress(self):
+        pending = self._export_progress_pending
+        self._export_progress_pending = None
+        if pending is None:
+            return
+        value, maximum, message = pending
         dialog = self._export_progress_dialog
         if not dialog or self._export_finalizing:
             return
@@ -4912,6 +6005,8 @@ class AppWindow(QMainWindow):
             dialog.setLabelText(message)
 
     def _finalize_export_state(self):
+        self._export_progress_timer.stop()
+        self._export_progress_pending = None
         dialog = self._export_progress_dialog
         if dialog:
             dialog.reset()
@@ -4919,17 +6014,13 @@ class AppWindow(QMainWindow):
             dialog.deleteLater()
         self._export_progress_dialog = None
 
-        worker = self._export_worker
-        if worker:
-            worker.deleteLater()
-        self._export_worker = None
-
         thread = self._export_thread
         if thread:
+            # deleteLater for worker and thread is wired to thread.finished
+            # at construction, and _reap_export_objects clears the Python
+            # refs there; quitting is enough, and wait() here would stall
+            # the event loop.
             thread.quit()
-            thread.wait()
-            thread.deleteLater()
-        self._export_thread = None
 
         self._set_export_ui_enabled(True)
         self._export_in_progress = False
@@ -4937,6 +6028,12 @@ class AppWindow(QMainWindow):
         self._export_finalizer_message = None
         self._export_finalizing = False
 
+    def _reap_export_objects(self, worker, thread):
+        if self._export_worker is worker:
+            self._export_worker = None
+        if self._export_thread is thread:
+            self._export_thread = None
+
     def _execute_export_finalizer(self, result: ExportResult) -> Optional[ExportResult]:
         finalizer = self._export_finalizer
         if not finalizer:
@@ -5022,7 +6119,7 @@ class AppWindow(QMainWindow):
         self.culling_widget = None
 
         self._load_app_state()
-        self.welcome_screen.update_recent_folders(self.recent_folders)
+        self.welcome_screen.update_recent_folders(list(self.recent_folders))
         self.stack.setCurrentWidget(self.welcome_screen)
         self.update_toolbar_state(is_culling=False)
         self.status.clearMessage()
@@ -5117,14 +6214,19 @@ class AppWindow(QMainWindow):
             self._toast_timer = QTimer(self)
             self._toast_timer.setSingleShot(True)
             self._toast_timer.timeout.connect(self._toast_label.hide)
+            self._toast_last_text: Optional[str] = None
 
-        self._toast_label.setText(text)
-        self._toast_label.adjustSize()
+        # setText + adjustSize force a style/layout pass; repeated toasts
+        # ("export complete" etc.) reuse the previous geometry.
+        if text != self._toast_last_text:
+            self._toast_label.setText(text)
+            self._toast_label.adjustSize()
+            self._toast_last_text = text
 
         w, h = self._toast_label.width(), self._toast_label.height()
         x = max(0, (self.width() - w) // 2)
         y = max(0, (self.height() - h) //2)
-        self._toast_label.setGeometry(x, y, w, h)
+        self._toast_label.move(x, y)
         self._toast_label.raise_()
         self._toast_label.show()
         self._toast_timer.start(ms)
@@ -5326,7 +6428,14 @@ def main():
         )
         font_id = -1
     else:
-        font_id = QFontDatabase.addApplicationFont(str(font_path))
+        # Memory-map the TTF and hand the buffer to Qt directly: pages fault
+        # in on demand and Qt skips its own stat/open/read of the path.
+        try:
+            with open(font_path, 'rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    font_id = QFontDatabase.addApplicationFontFromData(bytes(mm))
+        except Exception:
+            font_id = QFontDatabase.addApplicationFont(str(font_path))
 
     if font_id == -1:
         print(f"Warning: Could not load font '{font_path}'. Falling back to default.")
@@ -5343,14 +6452,26 @@ def main():
             print(f"Warning: Could not find font family in '{font_path}'.")
             setattr(app, "_custom_font_family", "Arial")
 
+    # Base colors go through QPalette: role lookups are cheap per-widget,
+    # whereas blanket QWidget/QDialog QSS rules force a selector match and
+    # style polish on every widget the culling session creates.
+    pal = QPalette()
+    pal.setColor(QPalette.Window, theme_qcolor('bg.base'))
+    pal.setColor(QPalette.WindowText, theme_qcolor('text.primary'))
+    pal.setColor(QPalette.Base, theme_qcolor('bg.surface'))
+    pal.setColor(QPalette.AlternateBase, theme_qcolor('bg.elevated'))
+    pal.setColor(QPalette.Text, theme_qcolor('text.primary'))
+    pal.setColor(QPalette.Button, theme_qcolor('bg.surface'))
+    pal.setColor(QPalette.ButtonText, theme_qcolor('text.primary'))
+    pal.setColor(QPalette.Highlight, theme_qcolor('accent.primary'))
+    pal.setColor(QPalette.HighlightedText, theme_qcolor('text.on_accent'))
+    pal.setColor(QPalette.Link, theme_qcolor('accent.primary'))
+    pal.setColor(QPalette.ToolTipBase, theme_qcolor('bg.elevated'))
+    pal.setColor(QPalette.ToolTipText, theme_qcolor('text.primary'))
+    pal.setColor(QPalette.PlaceholderText, theme_qcolor('text.tertiary'))
+    app.setPalette(pal)
+
     app.setStyleSheet(f"""
-        QWidget {{
-            background-color: {theme_color('bg.base')};
-            color: {theme_color('text.primary')};
-        }}
-        QMainWindow, QDialog {{
-            background-color: {theme_color('bg.base')};
-        }}
         QToolBar {{
             background: {theme_color('bg.surface')};
             border: none;
@@ -5415,9 +6536,6 @@ def main():
             padding: 5px;
             color: {theme_color('text.primary')};
         }}
-        QLabel {{
-            background-color: transparent;
-        }}
         QLabel a {{
             color: {theme_color('accent.primary')};
             text-decoration: none;